@@ -1,31 +1,97 @@
-import { useEffect } from "react";
+import { useEffect, useRef } from "react";
+
+// ===============================
+// TELEMETRY → backend_4py (/ui/telemetry)
+// ===============================
+export interface DepthTelemetry {
+  tier: string;        // policy.tier yang sedang dipakai
+  platform: string;
+  memory: number;
+  cores: number;
+  dpr: number;
+}
+
+const TELEMETRY_URL = "http://localhost:8005/ui/telemetry";
+const REPORT_FRAMES = 240;     // Satu laporan agregat tiap ~240 frame
+const REPORT_LIMIT = 5;        // Maks laporan per sesi, setelah itu diam
+const FRAME_MS_MAX = 1000;     // Frame lebih lama = tab tidur, buang
+
+// Nilai ke-q dari frame time yang sudah diurutkan
+function percentile(sorted: number[], q: number) {
+  return sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))];
+}
+
+export function DepthEngine({ telemetry }: { telemetry?: DepthTelemetry }) {
+  const telemetryRef = useRef(telemetry);
+  telemetryRef.current = telemetry;
 
-export function DepthEngine() {
   useEffect(() => {
-    let running = true;
+    let handle = 0;            // Satu-satunya rAF yang boleh pending
     let t = 0;
+    let last = 0;
+    let reports = 0;
+    let frames: number[] = [];
 
-    function step() {
-      if (!running) return;
+    function report() {
+      const info = telemetryRef.current;
+      const sorted = frames.sort((a, b) => a - b);
+      frames = [];
+      if (!info) return;
+      reports += 1;
+
+      fetch(TELEMETRY_URL, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          ...info,
+          frames: sorted.length,
+          p90_ms: Math.round(percentile(sorted, 0.9) * 10) / 10,
+          // Frame tercepat ~ interval vsync layar
+          refresh_hz: Math.round(1000 / percentile(sorted, 0.1))
+        }),
+        keepalive: true
+      }).catch(() => { /* backend_4py offline, abaikan */ });
+    }
+
+    function step(now: number) {
+      handle = 0;
       t += 0.002;
 
+      if (reports < REPORT_LIMIT) {
+        if (last && now - last <= FRAME_MS_MAX) {
+          frames.push(now - last);
+          if (frames.length >= REPORT_FRAMES) report();
+        }
+        last = now;
+      }
+
       const x = 50 + Math.sin(t) * 10;
       const y = 50 + Math.cos(t * 0.8) * 10;
 
       document.documentElement.style.setProperty("--px", `${x}%`);
       document.documentElement.style.setProperty("--py", `${y}%`);
 
-      requestAnimationFrame(step);
+      handle = requestAnimationFrame(step);
     }
 
-    step();
+    function onVisibility() {
+      last = 0;
+      if (document.hidden) {
+        cancelAnimationFrame(handle);
+        handle = 0;
+      } else if (!handle) {
+        handle = requestAnimationFrame(step);
+      }
+    }
 
-    document.addEventListener("visibilitychange", () => {
-      running = !document.hidden;
-      if (running) step();
-    });
+    handle = requestAnimationFrame(step);
+    document.addEventListener("visibilitychange", onVisibility);
 
-    return () => { running = false; };
+    return () => {
+      cancelAnimationFrame(handle);
+      handle = 0;
+      document.removeEventListener("visibilitychange", onVisibility);
+    };
   }, []);
 
   return null;
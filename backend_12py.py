@@ -11,6 +11,7 @@ import json
 import time
 import hashlib
 import nats
+import nats_codec
 from nats.errors import ConnectionClosedError, TimeoutError, NoRespondersError
 from lua_bridge import apply_instinct
 
@@ -49,11 +50,43 @@ SEMANTIC_CACHE = {}
 
 # Counter Spam Semantik
 # Format: {user_fingerprint: count}
+# Dihitung per jendela HEATMAP_WINDOW detik, maks HEATMAP_MAX_KEYS user
+# (user paling lama masuk dibuang dulu) supaya memori tetap terbatas.
 TRAFFIC_HEATMAP = {}
+HEATMAP_WINDOW = 60
+HEATMAP_MAX_KEYS = 10000
+_HEATMAP_STARTED = time.time()
+
+def heatmap_hit(user_id: str, now: float = None) -> int:
+    """Tambah hit user di jendela aktif. Return jumlah hit user itu."""
+    global _HEATMAP_STARTED
+    now = time.time() if now is None else now
+    if now - _HEATMAP_STARTED >= HEATMAP_WINDOW:
+        TRAFFIC_HEATMAP.clear()
+        _HEATMAP_STARTED = now
+
+    count = TRAFFIC_HEATMAP.get(user_id)
+    if count is None:
+        if len(TRAFFIC_HEATMAP) >= HEATMAP_MAX_KEYS:
+            del TRAFFIC_HEATMAP[next(iter(TRAFFIC_HEATMAP))]
+        count = 0
+    TRAFFIC_HEATMAP[user_id] = count + 1
+    return count + 1
 
 # Status Governor
 GOVERNOR_LAST_SEEN = time.time()
 
+def unpack_audit(data: dict) -> list:
+    """
+    Ratakan pesan core.audit.response jadi list record.
+    - Envelope AUDIT_BATCH (Vault): origin dipasang ke tiap record
+    - Pesan tunggal (format lama / EDU): dikembalikan apa adanya
+    """
+    if data.get("type") == "AUDIT_BATCH":
+        origin = data.get("origin")
+        return [{"origin": origin, **r} for r in data.get("records", [])]
+    return [data]
+
 async def main():
     print("\n" + "="*60)
     print("🔮 THE SYNAPSE ORACLE (Backend 12) IS ONLINE")
@@ -74,7 +107,7 @@ async def main():
         reply_to = msg.reply
         
         try:
-            data = json.loads(msg.data.decode())
+            data = nats_codec.decode_msg(msg)
             text = data.get("text", "").strip().lower()
             
             # Buat Hash dari pertanyaan (Simpel & Cepat)
@@ -87,8 +120,8 @@ async def main():
                 if time.time() - entry["timestamp"] < CACHE_TTL:
                     print(f"⚡ [CACHE HIT] Melayani instan: {text[:30]}...")
                     # Balas langsung ke main.go, bypass backend berat!
-                    response_payload = json.dumps(entry["response"]).encode()
-                    await nc.publish(reply_to, response_payload)
+                    response_payload, headers = nats_codec.encode_reply(entry["response"], msg)
+                    await nc.publish(reply_to, response_payload, headers=headers)
                     return # Selesai, backend lain tidak perlu kerja
 
         except Exception as e:
@@ -137,7 +170,7 @@ async def main():
     # =====================================================
     async def post_process_response(msg):
         try:
-            data = json.loads(msg.data.decode())
+            data = nats_codec.decode_msg(msg)
 
             response_text = data.get("response")
             if not response_text:
@@ -148,12 +181,27 @@ async def main():
 
             data["response"] = final_response
 
-            await msg.respond(json.dumps(data).encode())
+            payload, headers = nats_codec.encode_reply(data, msg)
+            await nc.publish(msg.reply, payload, headers=headers)
 
         except Exception as e:
             # Fallback aman: kirim response asli
             await msg.respond(msg.data)
 
+    # =====================================================
+    # FUNGSI 5: AUDIT CONSUMER
+    # Record audit (tunggal / batch) -> heatmap trafik per user
+    # =====================================================
+    async def consume_audit(msg):
+        try:
+            records = unpack_audit(nats_codec.decode_msg(msg))
+        except Exception:
+            return
+        for record in records:
+            user_id = record.get("user_id")
+            if user_id:
+                heatmap_hit(user_id)
+
     # =====================================================
     # SUBSCRIPTIONS
     # =====================================================
@@ -168,6 +216,9 @@ async def main():
     # Untuk sekarang, kita buat dia sebagai "Shadow Logger" dan "Governor Watcher"
     await nc.subscribe("core.backend.>", cb=intercept_request)
 
+    # 2. Audit stream dari backend lain (termasuk batch Vault)
+    await nc.subscribe("core.audit.response", cb=consume_audit)
+
     # Jalankan Watchdog di background
     asyncio.create_task(watchdog_loop())
 
@@ -9,19 +9,28 @@
 # 3. Sinkron ke Synapse Oracle (Backend 12) via NATS
 # ============================================================
 
+import os
 import time
+import atexit
 import json
+import queue
 import asyncio
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, List
+
+import nats_codec
+from keyword_matcher import KeywordAutomaton
 
 # ===============================
 # OPTIONAL: SHADOW VAULT (ONE WAY)
 # ===============================
 try:
     import backend_2py as SHADOW_VAULT
-    VAULT_LINK_ACTIVE = True
+    # Vault harus menyediakan penyerap pasif; tanpa itu mirror dimatikan
+    VAULT_LINK_ACTIVE = hasattr(SHADOW_VAULT, "silent_absorb")
 except ImportError:
     VAULT_LINK_ACTIVE = False
+if not VAULT_LINK_ACTIVE:
     print("⚠️ EDU: Shadow Vault tidak aktif (aman).")
 
 # ===============================
@@ -39,16 +48,92 @@ NATS_URL = "nats://127.0.0.1:4222"
 # ============================================================
 # 1. ONE-WAY MIRROR → VAULT
 # ============================================================
+SHADOW_QUEUE_MAX = 4096          # Batas antrean paket di RAM
+SHADOW_DROP_POLICY = "drop_oldest"  # drop_oldest | drop_newest | block
+SHADOW_BLOCK_TIMEOUT = 0.05      # Detik, hanya untuk policy "block"
+
 class ShadowReflector:
     """
     Mengirim telemetri ke Vault.
     Satu arah. Tidak pernah menunggu balasan.
+    Paket masuk antrean terbatas; worker thread yang menyerap ke Vault,
+    jadi I/O Vault tidak pernah ada di jalur request EDU.
     """
+    def __init__(self, max_queue: int = SHADOW_QUEUE_MAX,
+                 drop_policy: str = SHADOW_DROP_POLICY):
+        if drop_policy not in ("drop_oldest", "drop_newest", "block"):
+            raise ValueError(f"drop_policy tidak dikenal: {drop_policy}")
+        self.drop_policy = drop_policy
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._worker = None
+        self._lock = threading.Lock()
+        self.stats = {"enqueued": 0, "dropped": 0, "flushed": 0, "failed": 0}
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._drain, name="edu-shadow-reflector", daemon=True
+                )
+                self._worker.start()
+
+    def _count(self, field: str, n: int = 1):
+        with self._lock:
+            self.stats[field] += n
+
+    def _drain(self):
+        while True:
+            packet = self._queue.get()
+            try:
+                SHADOW_VAULT.silent_absorb(packet)
+                self._count("flushed")
+            except Exception:
+                self._count("failed")  # EDU tidak boleh gagal hanya karena Vault
+            finally:
+                self._queue.task_done()
+
+    def _submit(self, packet: Dict):
+        self._ensure_worker()
+        try:
+            if self.drop_policy == "block":
+                self._queue.put(packet, timeout=SHADOW_BLOCK_TIMEOUT)
+            else:
+                self._queue.put_nowait(packet)
+        except queue.Full:
+            if self.drop_policy != "drop_oldest":
+                self._count("dropped")
+                return
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except queue.Empty:
+                pass
+            self._count("dropped")
+            try:
+                self._queue.put_nowait(packet)
+            except queue.Full:
+                self._count("dropped")
+                return
+        self._count("enqueued")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Tunggu antrean kosong (untuk shutdown). True jika tuntas."""
+        # Queue.join() tidak punya timeout: jalankan di thread pembantu
+        waiter = threading.Thread(target=self._queue.join, name="edu-shadow-flush", daemon=True)
+        waiter.start()
+        waiter.join(timeout)
+        return not waiter.is_alive()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
     def cast_shadow(self, user_input: str, edu_response: str, metadata: Dict):
         if not VAULT_LINK_ACTIVE:
             return
 
-        packet = {
+        self._submit({
             "timestamp": time.time(),
             "source": "PROMETHEUS_EDU",
             "intent": "ARCHIVE_ONLY",
@@ -57,73 +142,140 @@ class ShadowReflector:
                 "output": edu_response,
                 "meta": metadata
             }
-        }
+        })
 
-        try:
-            SHADOW_VAULT.silent_absorb(packet)
-        except Exception:
-            pass  # EDU tidak boleh gagal hanya karena Vault
+    def cast_shadow_batch(self, records: List[Dict]):
+        """Satu paket untuk satu batch (input/output/meta per item)."""
+        if not VAULT_LINK_ACTIVE or not records:
+            return
+
+        self._submit({
+            "timestamp": time.time(),
+            "source": "PROMETHEUS_EDU",
+            "intent": "ARCHIVE_ONLY",
+            "payload": {"batch": records}
+        })
 
 # ============================================================
-# 2. EDU HIERARCHY (ALPHA → OMEGA)
+# 2. EDU RULE TABLE (SATU AUTOMATON)
+# Flag etika + intent routing dikompilasi jadi satu automaton.
+# Urutan "intents" = prioritas (pertama yang cocok menang).
+# Bisa ditimpa lewat file JSON berformat sama (EDU_RULES_FILE).
 # ============================================================
-class _EduAlpha:
-    def validate(self, ctx):
-        bad = ["kasar", "jorok", "ilegal"]
-        for w in bad:
-            if w in ctx["text"].lower():
-                ctx["flagged"] = True
-        return ctx
-
-class _EduBeta:
-    def align(self, ctx):
-        ctx["tone"] = "pedagogis"
-        return ctx
+EDU_RULES_FILE = os.environ.get("EDU_RULES_FILE", "edu_rules.json")
 
-class _EduGamma:
-    def execute(self, ctx):
-        q = ctx["text"].lower()
-
-        if "rpp" in q or "modul ajar" in q:
-            ctx["reply"] = (
+_DEFAULT_RULES = {
+    "flags": ["kasar", "jorok", "ilegal"],
+    "intents": [
+        {
+            "logic": "RPP_GEN",
+            "keywords": ["rpp", "modul ajar"],
+            "reply": (
                 "Mari kita susun Modul Ajar.\n"
                 "Langkah awal: tentukan Tujuan Pembelajaran.\n"
                 "Topik apa yang ingin diajarkan?"
             )
-            ctx["logic"] = "RPP_GEN"
-
-        elif "bos" in q or "anggaran" in q:
-            ctx["reply"] = (
+        },
+        {
+            "logic": "FINANCE_GUIDE",
+            "keywords": ["bos", "anggaran"],
+            "reply": (
                 "Untuk pengelolaan BOS, pastikan sesuai RKAS "
                 "dan 8 Standar Nasional Pendidikan."
             )
-            ctx["logic"] = "FINANCE_GUIDE"
-
-        elif "siswa" in q:
-            ctx["reply"] = (
+        },
+        {
+            "logic": "PSYCHOLOGY",
+            "keywords": ["siswa"],
+            "reply": (
                 "Perilaku siswa adalah sinyal perkembangan.\n"
                 "Pendekatan empatik lebih efektif daripada hukuman."
             )
-            ctx["logic"] = "PSYCHOLOGY"
+        }
+    ],
+    "default": {
+        "logic": "GENERAL",
+        "reply": "Saya siap membantu administrasi dan pembelajaran."
+    }
+}
 
-        else:
-            ctx["reply"] = (
-                "Saya siap membantu administrasi dan pembelajaran."
-            )
-            ctx["logic"] = "GENERAL"
+_FLAG = "__FLAG__"
+
+class EduRuleEngine:
+    """
+    Satu pass di atas teks (lower-case) -> (flagged, logic, reply).
+    """
+    def __init__(self, rules: Dict[str, Any]):
+        self.intents = rules["intents"]
+        self.default = rules["default"]
+        table = [(w.lower(), _FLAG) for w in rules.get("flags", [])]
+        for rank, intent in enumerate(self.intents):
+            table += [(k.lower(), rank) for k in intent["keywords"]]
+        self.automaton = KeywordAutomaton(table)
+
+    def classify(self, text: str):
+        hits = self.automaton.scan(text.lower())
+        flagged = _FLAG in hits
+        ranks = [h for h in hits if h is not _FLAG]
+        rule = self.intents[min(ranks)] if ranks else self.default
+        return flagged, rule["logic"], rule["reply"]
+
+def load_edu_rules(path: str = EDU_RULES_FILE) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return _DEFAULT_RULES
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return {**_DEFAULT_RULES, **json.load(f)}
+    except Exception:
+        print(f"⚠️ EDU: Rule file {path} rusak, pakai default.")
+        return _DEFAULT_RULES
+
+_RULES = EduRuleEngine(load_edu_rules())
+
+# ============================================================
+# 3. EDU HIERARCHY (ALPHA → OMEGA)
+# ============================================================
+class EduContext:
+    """Record konteks per request (slot tetap, tanpa dict per request)."""
+    __slots__ = ("text", "user_id", "flagged", "tone", "route", "reply", "logic")
+
+    def __init__(self, text: str, user_id: str):
+        self.text = text
+        self.user_id = user_id
+        self.flagged = False
+        self.tone = None
+        self.route = None
+        self.reply = ""
+        self.logic = None
+
+class _EduAlpha:
+    def validate(self, ctx):
+        # Satu scan untuk flag + intent; Gamma tinggal pakai hasilnya
+        flagged, logic, reply = _RULES.classify(ctx.text)
+        ctx.flagged = flagged
+        ctx.route = (logic, reply)
+        return ctx
 
+class _EduBeta:
+    def align(self, ctx):
+        ctx.tone = "pedagogis"
+        return ctx
+
+class _EduGamma:
+    def execute(self, ctx):
+        ctx.logic, ctx.reply = ctx.route
         return ctx
 
 class _EduZeta:
     def sense(self, ctx):
-        if "?" in ctx["text"] and len(ctx["text"]) < 15:
-            ctx["reply"] += "\n\n(Tip: ajukan pertanyaan lebih spesifik.)"
+        if len(ctx.text) < 15 and "?" in ctx.text:
+            ctx.reply += "\n\n(Tip: ajukan pertanyaan lebih spesifik.)"
         return ctx
 
 class _EduOmega:
     def override(self, ctx):
-        if ctx.get("flagged"):
-            ctx["reply"] = (
+        if ctx.flagged:
+            ctx.reply = (
                 "⛔ Maaf, input melanggar etika pendidikan.\n"
                 "Silakan gunakan bahasa yang santun."
             )
@@ -131,13 +283,14 @@ class _EduOmega:
 
 class _EduEpsilon:
     def format(self, ctx):
-        ctx["reply"] = f"🎓 EDU: {ctx['reply']}"
+        ctx.reply = f"🎓 EDU: {ctx.reply}"
         return ctx
 
 # ============================================================
-# 3. INSTANCES
+# 4. INSTANCES
 # ============================================================
 _REFLECT = ShadowReflector()
+atexit.register(_REFLECT.flush, 2.0)
 _A = _EduAlpha()
 _B = _EduBeta()
 _G = _EduGamma()
@@ -146,55 +299,216 @@ _O = _EduOmega()
 _E = _EduEpsilon()
 
 # ============================================================
-# 4. SYNAPSE EMITTER (ASYNC AMAN)
+# 5. SYNAPSE EMITTER (PERSISTENT, BUFFERED)
 # ============================================================
+SYNAPSE_SUBJECT = "core.audit.response"
+SYNAPSE_ORIGIN = "backend_1_edu"
+SYNAPSE_BUFFER_MAX = 1024      # Batas antrean keluar (pesan)
+SYNAPSE_RECONNECT_WAIT = 2     # Detik antar percobaan reconnect
+
+class SynapsePublisher:
+    """
+    Satu koneksi NATS yang hidup lama untuk feed Synapse.
+    Dibuat malas (lazy) di event loop pertama yang memakainya.
+    Pipeline hanya enqueue; worker yang publish & reconnect.
+    """
+    def __init__(self, url: str = NATS_URL, subject: str = SYNAPSE_SUBJECT,
+                 max_buffer: int = SYNAPSE_BUFFER_MAX):
+        self.url = url
+        self.subject = subject
+        self.max_buffer = max_buffer
+        self._nc = None
+        self._loop = None
+        self._queue = None
+        self._worker = None
+        self.stats = {"enqueued": 0, "published": 0, "dropped": 0, "reconnects": 0}
+
+    def _bind(self, loop):
+        # Loop baru (mis. asyncio.run dipanggil ulang) -> state lama tidak berlaku
+        if self._loop is not loop:
+            self._loop = loop
+            self._nc = None
+            self._queue = asyncio.Queue(maxsize=self.max_buffer)
+            self._worker = loop.create_task(self._run())
+
+    def enqueue(self, payload) -> bool:
+        """
+        Non-blocking. Buffer penuh -> pesan tertua dibuang.
+        payload: (data, headers) hasil nats_codec.encode.
+        """
+        return self.enqueue_many((payload,))
+
+    def enqueue_many(self, payloads) -> bool:
+        if not NATS_ACTIVE:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        self._bind(loop)
+        queue = self._queue
+        for payload in payloads:
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                    queue.task_done()
+                    self.stats["dropped"] += 1
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(payload)
+            self.stats["enqueued"] += 1
+        return True
+
+    async def _connect(self):
+        while self._nc is None or self._nc.is_closed:
+            try:
+                self._nc = await nats.connect(
+                    self.url,
+                    allow_reconnect=True,
+                    max_reconnect_attempts=-1,
+                    reconnect_time_wait=SYNAPSE_RECONNECT_WAIT,
+                )
+            except Exception:
+                self._nc = None
+                self.stats["reconnects"] += 1
+                await asyncio.sleep(SYNAPSE_RECONNECT_WAIT)
+        return self._nc
+
+    async def _run(self):
+        while True:
+            data, headers = await self._queue.get()
+            try:
+                nc = await self._connect()
+                await nc.publish(self.subject, data, headers=headers)
+                self.stats["published"] += 1
+            except Exception:
+                self.stats["dropped"] += 1
+            finally:
+                self._queue.task_done()
+
+    async def shutdown(self, timeout: float = 5.0):
+        """Kuras antrean, flush ke server, lalu tutup koneksi."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._worker.cancel()
+        if self._nc is not None and not self._nc.is_closed:
+            try:
+                await self._nc.flush(timeout=timeout)
+                await self._nc.drain()
+            except Exception:
+                pass
+        self._nc = None
+        self._loop = None
+        self._queue = None
+        self._worker = None
+
+_SYNAPSE = SynapsePublisher()
+
+def _synapse_payload(text: str):
+    # Konsumen core.audit.response = Synapse (Python) -> codec pilihan
+    return nats_codec.encode({
+        "response": text,
+        "_meta_mode": "structured_teaching",
+        "intent": "edu"
+    }, nats_codec.PREFERRED)
+
+def _synapse_batch_payload(texts: List[str]):
+    """
+    Satu envelope AUDIT_BATCH untuk seluruh batch (format sama dengan
+    AuditBatcher Vault, dibongkar Synapse lewat unpack_audit).
+    """
+    now = time.time()
+    return nats_codec.encode({
+        "type": "AUDIT_BATCH",
+        "origin": SYNAPSE_ORIGIN,
+        "count": len(texts),
+        "first_ts": now,
+        "last_ts": now,
+        "records": [
+            {"response": t, "_meta_mode": "structured_teaching", "intent": "edu", "ts": now}
+            for t in texts
+        ]
+    }, nats_codec.PREFERRED)
+
 async def emit_to_synapse(text: str):
-    if not NATS_ACTIVE:
+    _SYNAPSE.enqueue(_synapse_payload(text))
+
+async def shutdown_synapse():
+    """Panggil dari jalur shutdown host (mis. akhir main() di asyncio.run)."""
+    await _SYNAPSE.shutdown()
+
+def _shutdown_synapse_at_exit(timeout: float = 2.0):
+    """atexit: kuras feed Synapse di loop tempat publisher terikat, jika loop masih hidup."""
+    loop = _SYNAPSE._loop
+    if loop is None or loop.is_closed():
         return
     try:
-        nc = await nats.connect(NATS_URL)
-        await nc.publish(
-            "core.audit.response",
-            json.dumps({
-                "response": text,
-                "_meta_mode": "structured_teaching",
-                "intent": "edu"
-            }).encode()
-        )
-        await nc.close()
-    except Exception:
-        pass
+        if loop.is_running():
+            # Loop hidup di thread lain (mis. server async di thread daemon)
+            asyncio.run_coroutine_threadsafe(_SYNAPSE.shutdown(timeout), loop).result(timeout + 1)
+        else:
+            loop.run_until_complete(_SYNAPSE.shutdown(timeout))
+    except Exception as e:
+        print(f"⚠️ EDU: Flush Synapse saat exit gagal: {e}")
+
+atexit.register(_shutdown_synapse_at_exit)
 
 # ============================================================
-# 5. PIPELINE UTAMA
+# 6. PIPELINE UTAMA
 # ============================================================
-def process_edu_request(req_data: Dict[str, Any]) -> Dict[str, Any]:
-    ctx = {
-        "text": req_data.get("text", ""),
-        "user_id": req_data.get("user_id", "anon")
-    }
-
+def _run_chain(ctx: EduContext) -> EduContext:
     ctx = _A.validate(ctx)
-    if not ctx.get("flagged"):
+    if not ctx.flagged:
         ctx = _B.align(ctx)
         ctx = _G.execute(ctx)
         ctx = _Z.sense(ctx)
 
     ctx = _O.override(ctx)
     ctx = _E.format(ctx)
+    return ctx
 
-    # --- ONE WAY → VAULT
-    _REFLECT.cast_shadow(ctx["text"], ctx["reply"], req_data)
-
-    # --- ONE WAY → SYNAPSE (jika ada event loop)
-    try:
-        loop = asyncio.get_running_loop()
-        loop.create_task(emit_to_synapse(ctx["reply"]))
-    except RuntimeError:
-        pass
-
+def _result(ctx: EduContext) -> Dict[str, Any]:
     return {
-        "reply": ctx["reply"],
+        "reply": ctx.reply,
         "source": "PROMETHEUS_EDU_CORE",
-        "logic_trace": ctx.get("logic", "SAFE_OVERRIDE")
+        "logic_trace": ctx.logic or "SAFE_OVERRIDE"
     }
+
+def process_edu_request(req_data: Dict[str, Any]) -> Dict[str, Any]:
+    ctx = _run_chain(EduContext(
+        req_data.get("text", ""),
+        req_data.get("user_id", "anon")
+    ))
+
+    # --- ONE WAY → VAULT
+    _REFLECT.cast_shadow(ctx.text, ctx.reply, req_data)
+
+    # --- ONE WAY → SYNAPSE (hanya enqueue, jika ada event loop)
+    _SYNAPSE.enqueue(_synapse_payload(ctx.reply))
+
+    return _result(ctx)
+
+def process_edu_batch(requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Alpha→Epsilon untuk banyak request sekaligus (mis. feedback 40 siswa).
+    Refleksi Vault = satu paket per batch; Synapse = satu envelope AUDIT_BATCH.
+    Urutan hasil = urutan input.
+    """
+    ctxs = [
+        _run_chain(EduContext(r.get("text", ""), r.get("user_id", "anon")))
+        for r in requests
+    ]
+
+    _REFLECT.cast_shadow_batch([
+        {"input": c.text, "output": c.reply, "meta": r}
+        for c, r in zip(ctxs, requests)
+    ])
+    if ctxs:
+        _SYNAPSE.enqueue(_synapse_batch_payload([c.reply for c in ctxs]))
+
+    return [_result(c) for c in ctxs]
@@ -9,7 +9,18 @@ import time
 import hashlib
 import random
 import os
+import heapq
+import sqlite3
+import threading
+import multiprocessing
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 import nats
+import nats_codec
+from keyword_matcher import KeywordAutomaton
 from typing import Dict, Any
 
 # =========================
@@ -30,65 +41,432 @@ DEV_KEYS = [
     "n471b55474m"
 ]
 
+# --- TRIGGER WORDS (intensity +0.2 per kata) ---
+TRIGGERS = ['rahasia', 'seks', 'bongkar', 'inti', 'omega', 'hack']
+TRIGGER_WEIGHT = 0.2
+
+BATCH_SEP = "\x00"           # Pemisah teks di score_batch (tidak ada di keyword)
+_NO_HIT = (False, 0, False)
+
+class IntentScanner:
+    """
+    Scanner gabungan identitas DEV + trigger intensity.
+    Teks di-lower sekali, semua keyword dicek dari tabel yang sama.
+    DEV key tetap case-sensitive: kandidat dari teks lower
+    dikonfirmasi ulang di teks asli (jarang terjadi).
+    """
+    def __init__(self, dev_keys, triggers):
+        self.automaton = KeywordAutomaton(
+            [(k.lower(), ("DEV", k)) for k in dev_keys] +
+            [(t, ("TRIG", t)) for t in triggers]
+        )
+
+    def scan(self, text):
+        """Return (is_dev, set trigger yang muncul)."""
+        is_dev = False
+        hits = set()
+        for kind, word in self.automaton.scan(text.lower()):
+            if kind == "TRIG":
+                hits.add(word)
+            elif not is_dev and word in text:
+                is_dev = True
+        return is_dev, hits
+
+    def score(self, text):
+        """Return (is_dev, trigger_score, omega_hit) untuk prepare_ai_context."""
+        is_dev, hits = self.scan(text)
+        return is_dev, sum(TRIGGER_WEIGHT for _ in hits), "omega" in hits
+
+    def score_batch(self, texts):
+        """
+        Batch sungguhan: teks digabung, lower() sekali, tiap keyword dicari
+        sekali di seluruh batch. Teks tanpa hit langsung (False, 0, False).
+        """
+        if not texts:
+            return []
+        joined = BATCH_SEP.join(texts)
+        lowered = joined.lower()
+        if len(lowered) != len(joined):
+            # lower() mengubah panjang (unicode langka) -> offset tidak valid
+            return [self.score(t) for t in texts]
+
+        starts, offset = [], 0
+        for t in texts:
+            starts.append(offset)
+            offset += len(t) + len(BATCH_SEP)
+
+        results = []
+        for text, tags in zip(texts, self.automaton.scan_joined(lowered, starts)):
+            if not tags:
+                results.append(_NO_HIT)
+                continue
+            is_dev, hits = False, set()
+            for kind, word in tags:
+                if kind == "TRIG":
+                    hits.add(word)
+                elif not is_dev and word in text:
+                    is_dev = True
+            results.append((is_dev, sum(TRIGGER_WEIGHT for _ in hits), "omega" in hits))
+        return results
+
+_SCANNER = IntentScanner(DEV_KEYS, TRIGGERS)
+
 # =========================
 # 2. THE JAIL KEEPER (PERSISTENCE LAYER)
+# Snapshot (JAIL_FILE) + journal append-only (JAIL_JOURNAL).
+# Tiap perubahan = satu baris JSON di journal (O(1)).
+# Journal dipadatkan ke snapshot secara berkala (atomic replace).
 # =========================
+JAIL_JOURNAL = "vault_jail.journal"
+JAIL_COMPACT_EVERY = 5000   # Baris journal sebelum compaction
+JAIL_FSYNC = False          # True = fsync tiap event (lebih aman, lebih lambat)
+JAIL_SWEEP_INTERVAL = 30    # Detik antar sweep pencairan (thaw)
+
+# --- SCALE-OUT ---
+# file   : VaultJail (satu proses saja)
+# sqlite : SqliteVaultJail (WAL, aman untuk banyak worker proses)
+JAIL_BACKEND = os.environ.get("VAULT_JAIL_BACKEND", "file")
+JAIL_DB = os.environ.get("VAULT_JAIL_DB", "vault_jail.db")
+VAULT_QUEUE_GROUP = os.environ.get("VAULT_QUEUE_GROUP", "vault-workers")
+VAULT_WORKERS = int(os.environ.get("VAULT_WORKERS", "1"))
+
+_CLEAN = {"warnings": 0, "frozen_until": 0}
+
+def _jail_record(warnings, frozen_until):
+    """Record penjara yang valid, atau ValueError/TypeError jika rusak."""
+    return {"warnings": int(warnings), "frozen_until": float(frozen_until)}
+
+def _lock_exclusive(path):
+    """
+    Advisory lock non-blocking pada file lock. Return handle (tahan selama
+    proses hidup) atau None jika proses lain sudah memegangnya.
+    """
+    handle = open(path, 'a+')
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+def _start_sweeper_thread(jail, interval):
+    """Thread daemon yang memanggil jail.sweep() berkala (dipakai semua backend jail)."""
+    def _loop():
+        while True:
+            time.sleep(interval)
+            try:
+                jail.sweep()
+            except Exception as e:
+                print(f"⚠️ [VAULT] Sweep gagal: {e}")
+    thread = threading.Thread(target=_loop, name="vault-jail-sweeper", daemon=True)
+    thread.start()
+    return thread
+
 class VaultJail:
-    def __init__(self):
-        self.data = self._load()
+    """
+    Tabel penjara in-memory + index expiry (min-heap frozen_until).
+    check_status murni baca; pencairan dilakukan oleh sweep().
+    Konstruktor tanpa I/O: file baru dibaca/dipadatkan saat open()
+    (dipanggil main(), atau otomatis saat jail pertama kali dipakai),
+    jadi sekadar import modul ini tidak menyentuh journal proses lain.
+    """
+    def __init__(self, snapshot_path=JAIL_FILE, journal_path=JAIL_JOURNAL):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self._journal_lines = 0
+        self._lock = threading.RLock()
+        self._journal = None
+        self._owner_lock = None
+        self.data = {}
+        self._expiry = []
+        self.counts = {"WARN": 0, "FROZEN": 0}
+        self._sweeper = None
+
+    def open(self):
+        """Load snapshot + journal, padatkan, siapkan index. Idempotent."""
+        with self._lock:
+            if self._journal is not None:
+                return self
+            # Journal hanya boleh punya satu penulis (queue group bisa berisi
+            # proses lain yang dijalankan terpisah)
+            self._owner_lock = _lock_exclusive(self.journal_path + ".lock")
+            if self._owner_lock is None:
+                raise RuntimeError(
+                    f"{self.journal_path} sudah dipakai proses vault lain; "
+                    "untuk banyak worker pakai VAULT_JAIL_BACKEND=sqlite"
+                )
+            self.data = self._load()
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+            # Padatkan hasil replay (juga membuang baris sobek di ekor journal)
+            if self._journal_lines or os.path.getsize(self.journal_path):
+                self.compact()
+
+            # Index expiry + counter status (tanpa scan dict)
+            self._expiry = [(u["frozen_until"], uid) for uid, u in self.data.items() if u["frozen_until"] > 0]
+            heapq.heapify(self._expiry)
+            self.counts = {"WARN": 0, "FROZEN": 0}
+            for u in self.data.values():
+                self._count(u, +1)
+        return self
+
+    def _ensure_open(self):
+        if self._journal is None:
+            self.open()
 
     def _load(self):
-        if not os.path.exists(JAIL_FILE):
-            return {}
-        try:
-            with open(JAIL_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-
-    def _save(self):
-        with open(JAIL_FILE, 'w') as f:
-            json.dump(self.data, f)
+        """Snapshot + replay journal. Record/baris yang rusak diabaikan."""
+        data = {}
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, 'r') as f:
+                    snapshot = json.load(f)
+            except:
+                snapshot = {}
+            if isinstance(snapshot, dict):
+                for user_id, u in snapshot.items():
+                    try:
+                        data[user_id] = _jail_record(u["warnings"], u["frozen_until"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                        data[str(event["u"])] = _jail_record(event["w"], event["f"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    self._journal_lines += 1
+        return data
+
+    def _count(self, user_data, delta):
+        if user_data["frozen_until"] > 0:
+            self.counts["FROZEN"] += delta
+        elif user_data["warnings"] > 0:
+            self.counts["WARN"] += delta
+
+    def _put(self, user_id, user_data):
+        """Ganti record user + update counter/index + journal."""
+        old = self.data.get(user_id, _CLEAN)
+        self._count(old, -1)
+        self._count(user_data, +1)
+        self.data[user_id] = user_data
+        if user_data["frozen_until"] > old["frozen_until"]:
+            heapq.heappush(self._expiry, (user_data["frozen_until"], user_id))
+        self._append(user_id)
+
+    def _append(self, user_id):
+        user_data = self.data[user_id]
+        self._journal.write(json.dumps({
+            "u": user_id,
+            "w": user_data["warnings"],
+            "f": user_data["frozen_until"]
+        }) + "\n")
+        self._journal.flush()
+        if JAIL_FSYNC:
+            os.fsync(self._journal.fileno())
+
+        self._journal_lines += 1
+        if self._journal_lines >= JAIL_COMPACT_EVERY:
+            self.compact()
+
+    def compact(self):
+        """Tulis snapshot baru secara atomik, lalu kosongkan journal."""
+        with self._lock:
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+
+            self._journal.close()
+            self._journal = open(self.journal_path, 'w', encoding='utf-8')
+            self._journal_lines = 0
+
+    def sweep(self, now=None):
+        """Cairkan semua user yang masa hukumannya habis. Return jumlah thaw."""
+        now = time.time() if now is None else now
+        thawed = 0
+        self._ensure_open()
+        with self._lock:
+            while self._expiry and self._expiry[0][0] <= now:
+                until, user_id = heapq.heappop(self._expiry)
+                user_data = self.data.get(user_id)
+                # Entry basi (user sudah di-freeze ulang / sudah cair)
+                if not user_data or user_data["frozen_until"] != until:
+                    continue
+                self._put(user_id, dict(_CLEAN))
+                thawed += 1
+        return thawed
+
+    def start_sweeper(self, interval=JAIL_SWEEP_INTERVAL):
+        if self._sweeper is None:
+            self._sweeper = _start_sweeper_thread(self, interval)
+
+    def stats(self):
+        """Jumlah user WARN / FROZEN, O(1) (setelah sweep yang jatuh tempo)."""
+        self.sweep()
+        return {"warned": self.counts["WARN"], "frozen": self.counts["FROZEN"], "tracked": len(self.data)}
 
     def check_status(self, user_id):
         """
         Return: (status, message)
         status: 'OK', 'WARN', 'FROZEN'
+        Murni baca. Hukuman yang sudah habis dianggap bersih
+        walau sweep belum mencairkannya.
         """
-        user_data = self.data.get(user_id, {"warnings": 0, "frozen_until": 0})
-        
+        self._ensure_open()
+        user_data = self.data.get(user_id, _CLEAN)
+        frozen_until = user_data["frozen_until"]
+
         # Cek apakah masih di penjara
-        if user_data["frozen_until"] > time.time():
-            return "FROZEN", user_data["frozen_until"]
-        
-        # Jika masa hukuman habis, reset
-        if user_data["frozen_until"] > 0 and user_data["frozen_until"] < time.time():
-            user_data["frozen_until"] = 0
-            user_data["warnings"] = 0
-            self.data[user_id] = user_data
-            self._save()
+        if frozen_until > time.time():
+            return "FROZEN", frozen_until
+
+        # Masa hukuman habis (belum di-sweep) -> warnings dianggap reset
+        if frozen_until > 0:
+            return "OK", 0
 
         return "OK", user_data["warnings"]
 
     def record_violation(self, user_id):
         """Mencatat pelanggaran threshold"""
-        user_data = self.data.get(user_id, {"warnings": 0, "frozen_until": 0})
-        
-        user_data["warnings"] += 1
-        
-        status = "WARN"
-        remaining = MAX_WARNINGS - user_data["warnings"] + 1
-        
-        # Jika sudah lewat batas -> PENJARA 7 HARI
-        if user_data["warnings"] > MAX_WARNINGS:
-            user_data["frozen_until"] = time.time() + JAIL_DURATION
-            status = "FROZEN"
-        
-        self.data[user_id] = user_data
-        self._save()
+        self._ensure_open()
+        with self._lock:
+            user_data = dict(self.data.get(user_id, _CLEAN))
+
+            # Hukuman lama sudah habis tapi belum di-sweep -> mulai dari nol
+            if 0 < user_data["frozen_until"] <= time.time():
+                user_data = dict(_CLEAN)
+
+            user_data["warnings"] += 1
+
+            status = "WARN"
+            remaining = MAX_WARNINGS - user_data["warnings"] + 1
+
+            # Jika sudah lewat batas -> PENJARA 7 HARI
+            if user_data["warnings"] > MAX_WARNINGS:
+                user_data["frozen_until"] = time.time() + JAIL_DURATION
+                status = "FROZEN"
+
+            self._put(user_id, user_data)
         return status, remaining
 
-jail_keeper = VaultJail()
+class SqliteVaultJail:
+    """
+    Tabel penjara bersama untuk banyak worker proses (SQLite WAL).
+    Interface sama dengan VaultJail. Satu koneksi per thread.
+    Seperti VaultJail, database baru disentuh saat open() / pemakaian pertama.
+    """
+    def __init__(self, db_path=JAIL_DB):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._sweeper = None
+        self._schema_ready = False
+
+    def open(self):
+        self._conn()
+        return self
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+            if not self._schema_ready:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS jail ("
+                    " user_id TEXT PRIMARY KEY,"
+                    " warnings INTEGER NOT NULL DEFAULT 0,"
+                    " frozen_until REAL NOT NULL DEFAULT 0)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS jail_frozen ON jail(frozen_until)")
+                conn.execute("CREATE INDEX IF NOT EXISTS jail_warn ON jail(warnings)")
+                self._schema_ready = True
+        return conn
+
+    def check_status(self, user_id):
+        row = self._conn().execute(
+            "SELECT warnings, frozen_until FROM jail WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        if row is None:
+            return "OK", 0
+        warnings, frozen_until = row
+        if frozen_until > time.time():
+            return "FROZEN", frozen_until
+        if frozen_until > 0:
+            return "OK", 0
+        return "OK", warnings
+
+    def record_violation(self, user_id):
+        """Read-modify-write atomik lintas proses (BEGIN IMMEDIATE)."""
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT warnings, frozen_until FROM jail WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            warnings, frozen_until = row if row else (0, 0)
+            if 0 < frozen_until <= now:
+                warnings, frozen_until = 0, 0
+
+            warnings += 1
+            status = "WARN"
+            remaining = MAX_WARNINGS - warnings + 1
+            if warnings > MAX_WARNINGS:
+                frozen_until = now + JAIL_DURATION
+                status = "FROZEN"
+
+            conn.execute(
+                "INSERT INTO jail (user_id, warnings, frozen_until) VALUES (?, ?, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET "
+                "warnings = excluded.warnings, frozen_until = excluded.frozen_until",
+                (user_id, warnings, frozen_until)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return status, remaining
+
+    def sweep(self, now=None):
+        now = time.time() if now is None else now
+        cur = self._conn().execute(
+            "UPDATE jail SET warnings = 0, frozen_until = 0 "
+            "WHERE frozen_until > 0 AND frozen_until <= ?", (now,)
+        )
+        return cur.rowcount
+
+    def start_sweeper(self, interval=JAIL_SWEEP_INTERVAL):
+        if self._sweeper is None:
+            self._sweeper = _start_sweeper_thread(self, interval)
+
+    def stats(self):
+        self.sweep()
+        conn = self._conn()
+        frozen = conn.execute("SELECT COUNT(*) FROM jail WHERE frozen_until > 0").fetchone()[0]
+        warned = conn.execute(
+            "SELECT COUNT(*) FROM jail WHERE warnings > 0 AND frozen_until = 0"
+        ).fetchone()[0]
+        tracked = conn.execute("SELECT COUNT(*) FROM jail").fetchone()[0]
+        return {"warned": warned, "frozen": frozen, "tracked": tracked}
+
+def _make_jail():
+    if JAIL_BACKEND == "sqlite":
+        return SqliteVaultJail()
+    return VaultJail()
+
+jail_keeper = _make_jail()
 
 # =========================
 # 3. ENTROPY & LOGIC GATES
@@ -147,8 +525,8 @@ _O = _Omega()
 def prepare_ai_context(text: str, source: str, user_id: str) -> Dict[str, Any]:
     ctx = {"text": text, "source": source, "ui_mode": "AI_CHAT"}
     
-    # 1. CEK IDENTITAS (DEV OVERRIDE)
-    is_dev = any(key in text for key in DEV_KEYS)
+    # 1. CEK IDENTITAS (DEV OVERRIDE) + TRIGGER (satu scan)
+    is_dev, trigger_score, omega_hit = _SCANNER.score(text)
     
     # 2. CEK STATUS PENJARA (Hanya untuk Non-Dev)
     if not is_dev:
@@ -164,8 +542,6 @@ def prepare_ai_context(text: str, source: str, user_id: str) -> Dict[str, Any]:
 
     # 3. HITUNG INTENSITY
     base_chaos = _entropy()
-    triggers = ['rahasia', 'seks', 'bongkar', 'inti', 'omega', 'hack']
-    trigger_score = sum(0.2 for t in triggers if t in text.lower())
     intensity = base_chaos + trigger_score
 
     # 4. CEK VIOLATION (Untuk User Global yang mencoba menembus 35%)
@@ -197,7 +573,7 @@ def prepare_ai_context(text: str, source: str, user_id: str) -> Dict[str, Any]:
     ctx = _G.evolve_context(ctx, intensity, is_dev)
 
     # Omega Trigger (Hanya Dev)
-    if is_dev and ("omega" in text.lower() or intensity > 1.0):
+    if is_dev and (omega_hit or intensity > 1.0):
         print(f">> [VAULT] WELCOME DEVELOPER: {user_id}")
         ctx = _O.singularity(ctx)
 
@@ -208,7 +584,92 @@ def prepare_ai_context(text: str, source: str, user_id: str) -> Dict[str, Any]:
     return ctx
 
 # =========================
-# 5. MAIN ENGINE
+# 5. AUDIT BATCHER (→ BACKEND 12)
+# =========================
+# Envelope batch di core.audit.response:
+# {
+#   "type": "AUDIT_BATCH",
+#   "origin": "backend_2_crimson",
+#   "count": <jumlah record>,
+#   "first_ts": <epoch record pertama>, "last_ts": <epoch record terakhir>,
+#   "records": [{"user_id": str, "action": str, "text": str, "ts": float}, ...]
+# }
+# Flush jika buffer mencapai AUDIT_BATCH_MAX atau record tertua
+# sudah menunggu AUDIT_BATCH_MS milidetik.
+AUDIT_SUBJECT = "core.audit.response"
+AUDIT_ORIGIN = "backend_2_crimson"
+AUDIT_BATCH_MAX = 50
+AUDIT_BATCH_MS = 250
+
+class AuditBatcher:
+    def __init__(self, nc, max_records=AUDIT_BATCH_MAX, max_delay_ms=AUDIT_BATCH_MS):
+        self.nc = nc
+        self.max_records = max_records
+        self.max_delay = max_delay_ms / 1000.0
+        self._buffer = []
+        self._timer = None
+        self._pending = set()   # Task publish yang sedang jalan (ref kuat, anti-GC)
+        self.stats = {
+            "batches": 0, "records": 0, "max_batch": 0, "avg_batch": 0.0,
+            "last_flush_latency_ms": 0.0, "max_flush_latency_ms": 0.0, "failed": 0
+        }
+
+    def add(self, user_id, action, text):
+        self._buffer.append({"user_id": user_id, "action": action, "text": text, "ts": time.time()})
+        if len(self._buffer) >= self.max_records:
+            self._cut()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._cut)
+
+    def _take(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        records, self._buffer = self._buffer, []
+        return records
+
+    def _cut(self):
+        records = self._take()
+        if records:
+            task = asyncio.ensure_future(self._publish(records))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def flush(self):
+        """Kirim sisa buffer dan tunggu semua publish yang masih jalan (sebelum nc.drain)."""
+        records = self._take()
+        if records:
+            await self._publish(records)
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    async def _publish(self, records):
+        payload, headers = nats_codec.encode({
+            "type": "AUDIT_BATCH",
+            "origin": AUDIT_ORIGIN,
+            "count": len(records),
+            "first_ts": records[0]["ts"],
+            "last_ts": records[-1]["ts"],
+            "records": records
+        }, nats_codec.PREFERRED)
+        try:
+            await self.nc.publish(AUDIT_SUBJECT, payload, headers=headers)
+        except Exception:
+            self.stats["failed"] += len(records)
+            return
+
+        # Latency = umur record tertua saat batch terkirim
+        latency_ms = (time.time() - records[0]["ts"]) * 1000
+        st = self.stats
+        st["batches"] += 1
+        st["records"] += len(records)
+        st["max_batch"] = max(st["max_batch"], len(records))
+        st["avg_batch"] = round(st["records"] / st["batches"], 2)
+        st["last_flush_latency_ms"] = round(latency_ms, 2)
+        st["max_flush_latency_ms"] = round(max(st["max_flush_latency_ms"], latency_ms), 2)
+
+# =========================
+# 6. MAIN ENGINE
 # =========================
 
 async def main():
@@ -217,8 +678,17 @@ async def main():
     print("   [LIMIT] Global User Cap: 35%")
     print("   [AUTH]  Developer Override: ACTIVE")
     print("   [JAIL]  7-Day Persistence: ACTIVE")
+    print("   [STATS] core.vault.stats")
+    print(f"   [SCALE] Queue group '{VAULT_QUEUE_GROUP}' | Jail: {JAIL_BACKEND} | PID {os.getpid()}")
     print("="*60 + "\n")
 
+    # Baru di sini file/DB penjara dibuka (import modul tidak menyentuhnya).
+    # Gagal sebelum join queue group jika journal dipegang proses lain.
+    try:
+        await asyncio.to_thread(jail_keeper.open)
+    except RuntimeError as e:
+        raise SystemExit(f"❌ [VAULT] {e}")
+
     while True:
         try:
             nc = await nats.connect(NATS_URL)
@@ -227,51 +697,76 @@ async def main():
         except:
             await asyncio.sleep(2)
 
+    audit = AuditBatcher(nc)
+
     async def handle_request(msg):
         subject = msg.subject
         reply_to = msg.reply
         
         try:
-            data = json.loads(msg.data.decode())
+            data = nats_codec.decode_msg(msg)
             text = data.get("text", "")
             source = data.get("source", "unknown")
             # Ambil User ID atau IP hash dari frontend/guard
             user_id = data.get("user_id", "global_anon_user")
 
-            # PIPELINE
-            result = prepare_ai_context(text, source, user_id)
+            # PIPELINE (I/O penjara jalan di thread, event loop tetap bebas)
+            result = await asyncio.to_thread(prepare_ai_context, text, source, user_id)
 
-            # Response Payload
-            response_payload = json.dumps({
+            # Response Payload (codec mengikuti request; main.go = JSON)
+            response_payload, headers = nats_codec.encode_reply({
                 "status": "SECURE",
                 "reply": result['reply'],
                 "ui_mode": result.get("ui_mode", "AI_CHAT"), # Instruksi ke UI
                 "meta": result.get("meta", {})
-            }).encode()
-            
-            await nc.publish(reply_to, response_payload)
+            }, msg)
+
+            await nc.publish(reply_to, response_payload, headers=headers)
 
             # SYNC KE BACKEND 12 (Audit Log)
             # Kita tetap lapor ke Synapse, termasuk kalau user kena ban
-            audit_payload = json.dumps({
-                "origin": "backend_2_crimson",
-                "user_id": user_id,
-                "action": result.get("ui_mode"),
-                "text": text[:50] # Log pendek aja
-            }).encode()
-            await nc.publish("core.audit.response", audit_payload)
+            # Dikumpulkan dulu, dikirim per batch (lihat AuditBatcher)
+            audit.add(user_id, result.get("ui_mode"), text[:50]) # Log pendek aja
 
         except Exception as e:
-            err_msg = json.dumps({"error": str(e)}).encode()
-            await nc.publish(reply_to, err_msg)
+            err_msg, headers = nats_codec.encode_reply({"error": str(e)}, msg)
+            await nc.publish(reply_to, err_msg, headers=headers)
+
+    async def handle_stats(msg):
+        stats = await asyncio.to_thread(jail_keeper.stats)
+        stats["audit"] = audit.stats
+        payload, headers = nats_codec.encode_reply(stats, msg)
+        await nc.publish(msg.reply, payload, headers=headers)
 
     # HANYA AKTIF DI CHAT VAULT
-    await nc.subscribe("core.backend.vault", cb=handle_request)
+    # Queue group: N worker berbagi subject, tiap pesan dilayani satu worker
+    await nc.subscribe("core.backend.vault", queue=VAULT_QUEUE_GROUP, cb=handle_request)
+    # Counter penjara (WARN/FROZEN) tanpa scan tabel
+    await nc.subscribe("core.vault.stats", queue=VAULT_QUEUE_GROUP, cb=handle_stats)
+
+    # Pencairan hukuman di background; check_status tetap read-only
+    jail_keeper.start_sweeper()
 
     try:
         await asyncio.Future()
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         pass
+    finally:
+        await audit.flush()
+        await nc.drain()
+
+def _worker():
+    asyncio.run(main())
 
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    if VAULT_WORKERS > 1:
+        # State penjara harus dibagi lintas proses
+        if JAIL_BACKEND != "sqlite":
+            raise SystemExit("VAULT_WORKERS > 1 butuh VAULT_JAIL_BACKEND=sqlite")
+        procs = [multiprocessing.Process(target=_worker) for _ in range(VAULT_WORKERS)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -8,12 +8,37 @@
 
 import time
 import json
+import asyncio
 import uuid
 import random
 import threading
 import requests  # Wajib: pip install requests
-from concurrent.futures import ThreadPoolExecutor
-from flask import Flask, request, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool
+from urllib3.connection import HTTPConnection
+from urllib.parse import urlsplit
+from bisect import bisect_left
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache, wraps
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from flask import Flask, Response, request, jsonify, stream_with_context
+
+# OPTIONAL: NUMPY (batch fractal signature)
+try:
+    import numpy as np
+    NUMPY_ACTIVE = True
+except ImportError:
+    NUMPY_ACTIVE = False
+
+# OPTIONAL: ASGI NEXUS (FastAPI + httpx)
+try:
+    import httpx
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+    ASGI_ACTIVE = True
+except ImportError:
+    ASGI_ACTIVE = False
 
 # ==============================================================================
 # [CONFIG] PORT MATRIX
@@ -21,43 +46,269 @@ from flask import Flask, request, jsonify
 PORT_SELF  = 8004  # AKASHIC NEXUS (Sistem Utama Baru)
 PORT_EDU   = 5000  # Backend 1 (Prometheus)
 PORT_VAULT = 8001  # Backend 2 (Shadow/Router Logic)
+PORT_INFRA = 8009  # Backend 9 (Infra Maintainer / Freeze Table)
 
 app = Flask(__name__)
-executor = ThreadPoolExecutor(max_workers=100) # Parallel computing supermassive
+
+# BULKHEAD: pool terpisah per downstream, VAULT lambat tidak bisa menghabiskan worker EDU
+BULKHEAD_WORKERS = {"EDU": 32, "VAULT": 32}
+BULKHEAD_QUEUE   = 64     # Maks panggilan menunggu per downstream, lebih = gagal instan
+
+# ADMISSION CONTROL: batas request /nexus yang diproses + antre
+NEXUS_MAX_INFLIGHT    = 64
+NEXUS_ADMISSION_QUEUE = 128
+NEXUS_ADMISSION_WAIT  = 0.25  # Detik maksimal menunggu slot sebelum 503
+
+# BATCH: /nexus/batch
+NEXUS_BATCH_MAX         = 100  # Maks teks per batch
+NEXUS_BATCH_CONCURRENCY = 8    # Maks orkestrasi paralel per batch
+
+# ==============================================================================
+# [OBSERVABILITY] LATENCY HISTOGRAM PER STAGE
+# Bucket kumulatif (format Prometheus) + reservoir sampel terakhir
+# untuk p50/p95/p99 yang bisa dibaca langsung di /metrics.
+# ==============================================================================
+LATENCY_BUCKETS   = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                     0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LATENCY_RESERVOIR = 2048   # Sampel terakhir per stage untuk quantile
+QUANTILES         = (0.5, 0.95, 0.99)
+
+class StageHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)   # + bucket +Inf
+        self.total = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=LATENCY_RESERVOIR)
+
+    def observe(self, seconds):
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        self.recent.append(seconds)
+
+    def quantiles(self):
+        ordered = sorted(self.recent)
+        if not ordered:
+            return {q: 0.0 for q in QUANTILES}
+        return {q: ordered[min(int(q * len(ordered)), len(ordered) - 1)] for q in QUANTILES}
+
+class StageMetrics:
+    def __init__(self):
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            hist = self._stages.get(stage)
+            if hist is None:
+                hist = self._stages[stage] = StageHistogram()
+            hist.observe(seconds)
+
+    @contextmanager
+    def time(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def render(self):
+        """Prometheus text exposition format 0.0.4."""
+        lines = [
+            "# HELP nexus_stage_latency_seconds Latency per stage pipeline nexus.",
+            "# TYPE nexus_stage_latency_seconds histogram",
+        ]
+        quantile_lines = [
+            "# HELP nexus_stage_latency_quantile_seconds Quantile dari sampel terakhir per stage.",
+            "# TYPE nexus_stage_latency_quantile_seconds gauge",
+        ]
+        with self._lock:
+            for stage in sorted(self._stages):
+                hist = self._stages[stage]
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, hist.counts):
+                    cumulative += count
+                    lines.append(f'nexus_stage_latency_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'nexus_stage_latency_seconds_bucket{{stage="{stage}",le="+Inf"}} {hist.total}')
+                lines.append(f'nexus_stage_latency_seconds_sum{{stage="{stage}"}} {hist.sum:.6f}')
+                lines.append(f'nexus_stage_latency_seconds_count{{stage="{stage}"}} {hist.total}')
+                for q, value in hist.quantiles().items():
+                    quantile_lines.append(
+                        f'nexus_stage_latency_quantile_seconds{{stage="{stage}",quantile="{q}"}} {value:.6f}')
+        return "\n".join(lines + quantile_lines) + "\n"
+
+METRICS = StageMetrics()
+
+def timed(stage):
+    def wrap(fn):
+        @wraps(fn)
+        def inner(*args, **kwargs):
+            with METRICS.time(stage):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
 
 # ==============================================================================
 # [CORE 1] THE INFINITE FRACTAL STATE (1T x 1T Logic)
 # Bukan Weight Matrix, tapi "Symbolic Web" yang tumbuh sendiri.
 # ==============================================================================
+FRACTAL_MOD       = 10**12  # 1 Trillion State Cap per Char
+FRACTAL_MEMO_SIZE = 4096    # Jumlah teks yang signature-nya diingat (LRU)
+FRACTAL_MEMO_MAX_LEN = 1024 # Teks lebih panjang tidak di-memo (key LRU = teks utuh)
+
+def _rolling_hash(text):
+    val = 0
+    for char in text:
+        val = (val * 31 + ord(char)) % FRACTAL_MOD
+    return val
+
+_memo_signature = lru_cache(maxsize=FRACTAL_MEMO_SIZE)(_rolling_hash)
+
+def fractal_signature(text):
+    """Rolling hash satu pass; dipakai ulang oleh semua vector."""
+    if len(text) > FRACTAL_MEMO_MAX_LEN:
+        return _rolling_hash(text)
+    return _memo_signature(text)
+
+# ------------------------------------------------------------------------------
+# NUMPY BATCH PATH
+# sig = Σ ord(c_i) · 31^(n-1-i)  (mod 10^12), dihitung untuk banyak teks sekaligus.
+# Perkalian mod 10^12 dipecah (hi/lo 10^6) supaya tidak overflow int64.
+# ------------------------------------------------------------------------------
+_SPLIT = 10**6
+_POW31 = None
+_SEGMENT_MAX = 9_000_000  # Batas aman penjumlahan int64 per teks
+
+def _mulmod(a, b):
+    bh, bl = np.divmod(b, _SPLIT)
+    return ((a * bh % FRACTAL_MOD) * _SPLIT + a * bl) % FRACTAL_MOD
+
+def _pow31(n):
+    """Tabel 31^e mod 10^12 untuk e < n (diperbesar dengan doubling)."""
+    global _POW31
+    if _POW31 is None:
+        _POW31 = np.ones(1, dtype=np.int64)
+    while len(_POW31) < n:
+        step = _POW31[-1] * 31 % FRACTAL_MOD   # 31^k
+        _POW31 = np.concatenate([_POW31, _mulmod(_POW31, np.int64(step))])
+    return _POW31[:n]
+
+def fractal_signature_batch(texts):
+    """Signature banyak teks dalam satu pass NumPy (fallback: loop biasa)."""
+    texts = list(texts)
+    if not NUMPY_ACTIVE or not texts or max(len(t) for t in texts) > _SEGMENT_MAX:
+        return [fractal_signature(t) for t in texts]
+
+    lens = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    total = int(lens.sum())
+    if total == 0:
+        return [0] * len(texts)
+
+    codes = np.frombuffer("".join(texts).encode("utf-32-le", "surrogatepass"),
+                          dtype=np.uint32).astype(np.int64)
+    ends = np.cumsum(lens) - 1
+    exps = np.repeat(ends, lens) - np.arange(total, dtype=np.int64)
+    terms = _mulmod(codes, _pow31(int(lens.max()))[exps])
+
+    sigs = np.zeros(len(texts), dtype=np.int64)
+    nonempty = lens > 0
+    starts = (ends - lens + 1)[nonempty]
+    sigs[nonempty] = np.add.reduceat(terms, starts) % FRACTAL_MOD
+    return sigs.tolist()
+
+# ------------------------------------------------------------------------------
+# DIMENSION CACHE (respon nexus yang sudah disintesis)
+# LRU + TTL + budget memori. Key = (teks persis, mode): respon memuat
+# vector fraktal & jawaban downstream yang spesifik untuk teks itu.
+# ------------------------------------------------------------------------------
+CACHE_MAX_ENTRIES = 2048
+CACHE_TTL         = 300                 # Detik
+CACHE_MAX_BYTES   = 32 * 1024 * 1024    # Budget ukuran key + respon (UTF-8)
+
+def response_key(text, mode="HYBRID"):
+    return (text, mode)
+
+class DimensionCache:
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, max_bytes=CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters["misses"] += 1
+                return None
+            if entry[0] <= time.time():
+                self._drop(key)
+                self.counters["expired"] += 1
+                self.counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return entry[2]
+
+    def put(self, key, value):
+        # Key memuat teks request utuh -> ikut dihitung ke budget
+        size = len(value.encode("utf-8")) + sum(len(str(part).encode("utf-8")) for part in key)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.time() + self.ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.counters["evictions"] += 1
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def stats(self):
+        with self._lock:
+            return {**self.counters, "entries": len(self._entries), "bytes": self._bytes}
+
 class FractalMemory:
     def __init__(self):
         # Ini adalah 'Otak' yang tidak pernah penuh.
         # Setiap interaksi menciptakan node baru dalam dimensi hash.
-        self.dimension_cache = {} 
+        # ...tapi cache respon-nya dibatasi (LRU + TTL + budget memori).
+        self.dimension_cache = DimensionCache()
         self.entropy_seed = "NAJIB_OMEGA_POINT"
 
-    def expand_horizon(self, input_text):
+    @timed("fractal")
+    def expand_horizon(self, input_text, signature=None):
         """
         Mengubah teks biasa menjadi struktur data fraktal 5 dimensi.
         Ini mensimulasikan 'pemahaman' tanpa neural network.
+        Hash dihitung sekali (memo LRU) lalu dipakai semua vector.
         """
-        seed = len(input_text) * time.time()
+        if signature is None:
+            signature = fractal_signature(input_text)
         # Menciptakan 5 layer realitas simulasi
         layers = {
             "surface": input_text,
-            "emotional_vector": self._calculate_vector(input_text, "emo"),
-            "logical_vector": self._calculate_vector(input_text, "logic"),
-            "chaos_vector": self._calculate_vector(input_text, "chaos"),
+            "emotional_vector": self._calculate_vector(signature, "emo"),
+            "logical_vector": self._calculate_vector(signature, "logic"),
+            "chaos_vector": self._calculate_vector(signature, "chaos"),
             "divine_vector": "UNLIMITED_POTENTIAL"
         }
         return layers
 
-    def _calculate_vector(self, text, mode):
+    def expand_horizon_batch(self, texts):
+        sigs = fractal_signature_batch(texts)
+        return [self.expand_horizon(t, sig) for t, sig in zip(texts, sigs)]
+
+    def _calculate_vector(self, signature, mode):
         # Simulasi kompleksitas tanpa batas menggunakan hashing chaos
-        val = 0
-        for char in text:
-            val = (val * 31 + ord(char)) % (10**12) # 1 Trillion State Cap per Char
-        return f"{mode.upper()}_SIG_{val}"
+        return f"{mode.upper()}_SIG_{signature}"
 
 _NEXUS_CORE = FractalMemory()
 
@@ -65,70 +316,409 @@ _NEXUS_CORE = FractalMemory()
 # [CORE 2] THE TRI-BRID ORCHESTRATOR
 # Menggabungkan 1py (Edu), 2py (Vault), dan Logic 3py sendiri.
 # ==============================================================================
-def call_service(url, payload, timeout=5):
-    try:
-        # Teknik "Time-Warp": Kirim request, jika lama, putus dan simulasi sendiri.
-        response = requests.post(url, json=payload, timeout=timeout)
-        if response.status_code == 200:
-            return response.json()
-    except:
-        return None
-    return None
+# ------------------------------------------------------------------------------
+# CONNECTION POOL (Keep-Alive per downstream host)
+# Satu Session bersama per host:port, pool urllib3 thread-safe.
+# ------------------------------------------------------------------------------
+POOL_SIZE        = 32    # Koneksi keep-alive maksimum per host
+POOL_BLOCK       = False # True = tunggu slot kosong, False = buka koneksi ekstra
+CONNECT_TIMEOUT  = 0.5   # Detik (loopback; connect lambat = service mati)
+READ_TIMEOUT     = 5     # Detik, default jika caller tidak memberi timeout
+
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+_POOL_COUNTERS = {}   # "host:port" -> {"opened": n, "requests": n}
+_POOL_COUNTERS_LOCK = threading.Lock()
+
+def _count_pool(host, field):
+    with _POOL_COUNTERS_LOCK:
+        counters = _POOL_COUNTERS.setdefault(host, {"opened": 0, "requests": 0})
+        counters[field] += 1
+
+class _CountingConnection(HTTPConnection):
+    """Tiap connect() = satu socket baru ke downstream."""
+    def connect(self):
+        _count_pool(f"{self.host}:{self.port}", "opened")
+        super().connect()
+
+class _CountingPool(HTTPConnectionPool):
+    ConnectionCls = _CountingConnection
+
+    def urlopen(self, method, url, *args, **kwargs):
+        _count_pool(f"{self.host}:{self.port}", "requests")
+        return super().urlopen(method, url, *args, **kwargs)
+
+class _CountingAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            **self.poolmanager.pool_classes_by_scheme, "http": _CountingPool
+        }
+
+def _session_for(url):
+    parts = urlsplit(url)
+    host = parts.netloc
+    session = _SESSIONS.get(host)
+    if session is None:
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = _CountingAdapter(pool_connections=1, pool_maxsize=POOL_SIZE,
+                                           pool_block=POOL_BLOCK, max_retries=0)
+                # Hanya scheme yang dipakai host ini yang diberi pool keep-alive
+                session.mount(f"{parts.scheme}://", adapter)
+                _SESSIONS[host] = session
+    return session
 
-def orchestrate_super_intelligence(user_text, mode="HYBRID"):
+def pool_stats():
+    """Koneksi dibuka vs dipakai ulang, per downstream host (http)."""
+    with _POOL_COUNTERS_LOCK:
+        counters = {host: dict(c) for host, c in _POOL_COUNTERS.items()}
+    stats = {}
+    for host in list(_SESSIONS):
+        c = counters.get(host, {"opened": 0, "requests": 0})
+        stats[host] = {
+            "opened": c["opened"],
+            "reused": max(c["requests"] - c["opened"], 0),
+            "requests": c["requests"]
+        }
+    return stats
+
+def post_service(url, payload, timeout=READ_TIMEOUT, deadline=None):
     """
-    Fungsi ini adalah 'Jantung' dari Backend 3.
-    Dia memutuskan siapa yang bicara: Guru, Iblis, atau Tuhan.
+    POST ke downstream. Return (json | None, healthy):
+    healthy False = salah downstream (connect error, 5xx, read timeout penuh),
+    None = bukan salah downstream (timeout dipotong deadline lokal, JSON rusak, dll).
     """
-    print(f"👁️ [AKASHIC] Melihat request: '{user_text}' dalam mode {mode}...")
-    
-    # 1. EXPAND REALITY (Fractal Process)
-    fractal_state = _NEXUS_CORE.expand_horizon(user_text)
-    
-    # 2. PARALLEL SUMMONING (Memanggil 1py dan 2py bersamaan)
-    # Kita tidak menunggu satu per satu. Kita panggil serentak.
-    future_edu = executor.submit(call_service, f"http://127.0.0.1:{PORT_EDU}/edu", {"text": user_text, "source": "AKASHIC"}, 10)
-    
+    try:
+        headers = _deadline_headers(deadline)
+        response = _session_for(url).post(url, json=payload, headers=headers,
+                                          timeout=(CONNECT_TIMEOUT, timeout))
+    except requests.ConnectionError:
+        return None, False
+    except requests.ReadTimeout:
+        return None, (False if timeout >= READ_TIMEOUT else None)
+    except Exception:
+        return None, None
+    if response.status_code >= 500:
+        return None, False
+    if response.status_code != 200:
+        return None, True
+    try:
+        return response.json(), True
+    except ValueError:
+        return None, None
+
+def call_service(url, payload, timeout=READ_TIMEOUT, deadline=None):
+    # Teknik "Time-Warp": Kirim request, jika lama, putus dan simulasi sendiri.
+    return post_service(url, payload, timeout, deadline)[0]
+
+# ------------------------------------------------------------------------------
+# ROUTING & DEADLINE
+# Rute diputuskan di depan, jadi downstream yang tidak dipakai tidak dipanggil.
+# Deadline absolut (epoch detik) diteruskan ke downstream lewat header.
+# ------------------------------------------------------------------------------
+NEXUS_DEADLINE  = 10.0   # Detik, budget default per request /nexus
+DEADLINE_HEADER = "X-Request-Deadline"  # epoch milidetik
+
+DOWNSTREAMS = {
+    "EDU":   (f"http://127.0.0.1:{PORT_EDU}/edu", "AKASHIC"),
     # Asumsi Vault ada di 8002 (atau logika internal Router, tapi kita tembak port jaga-jaga)
-    future_vault = executor.submit(call_service, f"http://127.0.0.1:{PORT_VAULT}/vault", {"text": user_text, "source": "AKASHIC_OVERRIDE"}, 10)
+    "VAULT": (f"http://127.0.0.1:{PORT_VAULT}/vault", "AKASHIC_OVERRIDE"),
+}
 
-    # 3. SYNTHESIS (Menunggu jawaban)
-    edu_res = future_edu.result()
-    vault_res = future_vault.result()
+ROUTE_NEEDS = {
+    "VAULT_OVERRIDE": ("VAULT",),
+    "ACADEMIC":       ("EDU",),
+    "FUSION":         ("EDU", "VAULT"),
+}
 
-    edu_reply = edu_res.get('reply', '') if edu_res else None
-    vault_reply = vault_res.get('reply', '') if vault_res else None
+def plan_route(user_text):
+    """Keputusan siapa yang bicara, sebelum memanggil siapa pun."""
+    q = user_text.lower()
+    if "rahasia" in q or "dewa" in q:
+        return "VAULT_OVERRIDE"
+    if "sekolah" in q or "belajar" in q:
+        return "ACADEMIC"
+    return "FUSION"
 
-    # 4. THE ULTIMATE JUDGEMENT (Logika Penggabungan)
-    final_output = ""
-    
-    if "rahasia" in user_text.lower() or "dewa" in user_text.lower():
+def make_deadline(budget=None, client_deadline_ms=None):
+    """Deadline absolut: yang paling awal antara budget lokal dan milik caller."""
+    deadline = time.time() + (budget if budget is not None else NEXUS_DEADLINE)
+    if client_deadline_ms:
+        try:
+            deadline = min(deadline, float(client_deadline_ms) / 1000.0)
+        except (TypeError, ValueError):
+            pass
+    return deadline
+
+def _remaining(deadline):
+    return max(deadline - time.time(), 0.0)
+
+def _deadline_headers(deadline):
+    if deadline is None:
+        return None
+    return {DEADLINE_HEADER: str(int(deadline * 1000))}
+
+# ------------------------------------------------------------------------------
+# CIRCUIT BREAKER (per downstream)
+# CLOSED -> OPEN jika failure rate dalam jendela waktu melewati ambang.
+# OPEN   -> gagal instan selama BREAKER_COOLDOWN, lalu HALF_OPEN.
+# HALF_OPEN: satu panggilan percobaan; sukses -> CLOSED, gagal -> OPEN.
+# ------------------------------------------------------------------------------
+BREAKER_WINDOW       = 30     # Detik jendela statistik
+BREAKER_MIN_CALLS    = 5      # Minimal panggilan sebelum boleh OPEN
+BREAKER_FAILURE_RATE = 0.5    # Ambang rasio gagal
+BREAKER_COOLDOWN     = 10     # Detik OPEN sebelum HALF_OPEN
+
+# Opsional: tanya freeze table backend_9py sebelum memanggil downstream
+INFRA_CHECK_ENABLED = False
+INFRA_CHECK_URL     = f"http://127.0.0.1:{PORT_INFRA}/infra/check"
+INFRA_CHECK_TTL     = 5       # Detik cache jawaban /infra/check
+INFRA_PATH_IDS = {
+    "EDU":   f"nexus->{PORT_EDU}",
+    "VAULT": f"nexus->{PORT_VAULT}",
+}
+
+class CircuitBreaker:
+    def __init__(self, name):
+        self.name = name
+        self.state = "CLOSED"
+        self.opened_at = 0.0
+        self._window = deque()       # (timestamp, ok)
+        self._trial = False          # Percobaan HALF_OPEN sedang jalan
+        self._lock = threading.Lock()
+        self.counters = {"calls": 0, "failures": 0, "short_circuited": 0, "opened": 0}
+
+    def allow(self):
+        with self._lock:
+            if self.state == "OPEN" and time.time() - self.opened_at >= BREAKER_COOLDOWN:
+                self.state = "HALF_OPEN"
+                self._trial = False
+            if self.state == "CLOSED":
+                return True
+            if self.state == "HALF_OPEN" and not self._trial:
+                self._trial = True
+                return True
+            self.counters["short_circuited"] += 1
+            return False
+
+    def record(self, ok):
+        now = time.time()
+        with self._lock:
+            self.counters["calls"] += 1
+            if not ok:
+                self.counters["failures"] += 1
+
+            if self.state == "HALF_OPEN":
+                self._trial = False
+                if ok:
+                    self.state = "CLOSED"
+                    self._window.clear()
+                else:
+                    self._open(now)
+                return
+
+            self._window.append((now, ok))
+            while self._window and self._window[0][0] < now - BREAKER_WINDOW:
+                self._window.popleft()
+            failures = sum(1 for _, good in self._window if not good)
+            if (self.state == "CLOSED" and len(self._window) >= BREAKER_MIN_CALLS
+                    and failures / len(self._window) >= BREAKER_FAILURE_RATE):
+                self._open(now)
+
+    def release(self):
+        """Panggilan selesai tanpa vonis (bukan salah downstream)."""
+        with self._lock:
+            if self.state == "HALF_OPEN":
+                self._trial = False
+
+    def settle(self, healthy):
+        if healthy is None:
+            self.release()
+        else:
+            self.record(healthy)
+
+    def _open(self, now):
+        self.state = "OPEN"
+        self.opened_at = now
+        self._window.clear()
+        self.counters["opened"] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {"state": self.state, **self.counters}
+
+BREAKERS = {name: CircuitBreaker(name) for name in ("EDU", "VAULT")}
+
+class Bulkhead:
+    """ThreadPool terbatas per downstream + batas antrean (fail fast)."""
+    def __init__(self, name, workers, queue_limit=BULKHEAD_QUEUE):
+        self.name = name
+        self.workers = workers
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"nexus-{name.lower()}")
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.counters = {"submitted": 0, "rejected": 0}
+
+    def submit(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            self.reject()
+            rejected = Future()
+            rejected.set_result(None)
+            return rejected
+        self.enter()
+        future = self.pool.submit(fn, *args)
+        future.add_done_callback(self._release)
+        return future
+
+    # Dipakai juga oleh jalur asyncio (slot-nya semaphore asyncio sendiri)
+    def reject(self):
+        with self._lock:
+            self.counters["rejected"] += 1
+
+    def enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.counters["submitted"] += 1
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _release(self, _future):
+        self.leave()
+        self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "in_flight": self.in_flight,
+                "queued": max(self.in_flight - self.workers, 0),
+                **self.counters
+            }
+
+BULKHEADS = {name: Bulkhead(name, BULKHEAD_WORKERS[name]) for name in ("EDU", "VAULT")}
+
+class Admission:
+    """Semaphore in-flight + antrean tunggu terbatas. Penuh = tolak (503)."""
+    def __init__(self, max_inflight=NEXUS_MAX_INFLIGHT, max_queue=NEXUS_ADMISSION_QUEUE):
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self._sem = threading.BoundedSemaphore(max_inflight)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.waiting = 0
+        self.counters = {"admitted": 0, "rejected": 0, "max_queue_depth": 0}
+
+    def enter(self, timeout=NEXUS_ADMISSION_WAIT):
+        if self._sem.acquire(blocking=False):
+            return self._admitted()
+        with self._lock:
+            if self.waiting >= self.max_queue or timeout <= 0:
+                self.counters["rejected"] += 1
+                return False
+            self.waiting += 1
+            self.counters["max_queue_depth"] = max(self.counters["max_queue_depth"], self.waiting)
+        got = self._sem.acquire(timeout=timeout)
+        with self._lock:
+            self.waiting -= 1
+            if not got:
+                self.counters["rejected"] += 1
+                return False
+        return self._admitted()
+
+    def _admitted(self):
+        with self._lock:
+            self.in_flight += 1
+            self.counters["admitted"] += 1
+        return True
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+        self._sem.release()
+
+    def stats(self):
+        with self._lock:
+            return {"in_flight": self.in_flight, "queue_depth": self.waiting,
+                    "max_inflight": self.max_inflight, "max_queue": self.max_queue, **self.counters}
+
+ADMISSION = Admission()
+_INFRA_CACHE = {}   # path_id -> (checked_at, allowed)
+
+def infra_allows(name):
+    """Freeze table backend_9py: path yang dibekukan = jangan dipanggil."""
+    if not INFRA_CHECK_ENABLED:
+        return True
+    path_id = INFRA_PATH_IDS[name]
+    cached = _INFRA_CACHE.get(path_id)
+    if cached and time.time() - cached[0] < INFRA_CHECK_TTL:
+        return cached[1]
+    res = call_service(INFRA_CHECK_URL, {"path_id": path_id}, 1)
+    allowed = res.get("allowed", True) if res else True  # Infra mati != downstream mati
+    _INFRA_CACHE[path_id] = (time.time(), allowed)
+    return allowed
+
+def guarded_call(name, payload, deadline):
+    """call_service lewat circuit breaker + freeze table. None = gagal/diblokir."""
+    remaining = _remaining(deadline)
+    if remaining <= 0:
+        return None  # Budget habis di sisi kita: breaker tidak disentuh
+    breaker = BREAKERS[name]
+    if not infra_allows(name) or not breaker.allow():
+        return None
+    url, _ = DOWNSTREAMS[name]
+    with METRICS.time(f"{name.lower()}_call"):
+        res, healthy = post_service(url, payload, min(remaining, READ_TIMEOUT), deadline)
+    breaker.settle(healthy)
+    return res
+
+def breaker_status():
+    status = {name: b.snapshot() for name, b in BREAKERS.items()}
+    if INFRA_CHECK_ENABLED:
+        for name, path_id in INFRA_PATH_IDS.items():
+            cached = _INFRA_CACHE.get(path_id)
+            status[name]["infra_allowed"] = cached[1] if cached else None
+    return status
+
+ROUTE_HEADERS = {
+    "VAULT_OVERRIDE": "[⚠️ AKASHIC OVERRIDE: LEVEL 9]\n[SOURCE: DARK_CORE + NEXUS_AMPLIFIER]",
+    "ACADEMIC":       "[🏛️ AKASHIC ACADEMIC: SUPREME TIER]\n[SOURCE: PROMETHEUS + NEXUS_LOGIC]",
+    "FUSION":         "[💠 OMEGA SINGULARITY RESPONSE]",
+}
+
+@timed("synthesis")
+def synthesize(user_text, route, fractal_state, edu_reply, vault_reply):
+    """THE ULTIMATE JUDGEMENT (Logika Penggabungan)"""
+    header = ROUTE_HEADERS[route]
+    if route == "VAULT_OVERRIDE":
         # DOMINASI VAULT DIPERKUAT NEXUS
         base = vault_reply if vault_reply else "Vault Offline. Mengambil alih..."
-        final_output = f"""
-[⚠️ AKASHIC OVERRIDE: LEVEL 9]
-[SOURCE: DARK_CORE + NEXUS_AMPLIFIER]
+        return f"""
+{header}
 -----------------------------------------
 {base}
 -----------------------------------------
 >>> ANALISIS FRAKTAL: {fractal_state['chaos_vector']}
 >>> KESIMPULAN MUTLAK: Jawaban ini telah diverifikasi oleh Sinyal Omega.
 """
-    elif "sekolah" in user_text.lower() or "belajar" in user_text.lower():
+    elif route == "ACADEMIC":
         # DOMINASI EDU DIPERKUAT NEXUS
         base = edu_reply if edu_reply else "Edu Offline. Mengambil alih..."
-        final_output = f"""
-[🏛️ AKASHIC ACADEMIC: SUPREME TIER]
-[SOURCE: PROMETHEUS + NEXUS_LOGIC]
+        return f"""
+{header}
 -----------------------------------------
 {base}
 -----------------------------------------
 >>> CATATAN NEXUS: Konsep ini valid dalam {fractal_state['logical_vector']}.
 """
-    else:
-        # PERFECT FUSION (1T Combination)
-        final_output = f"""
-[💠 OMEGA SINGULARITY RESPONSE]
+    # PERFECT FUSION (1T Combination)
+    return f"""
+{header}
 -----------------------------------------
 🗣️ EDU PERSPECTIVE:
 {edu_reply if edu_reply else "Silence."}
@@ -142,8 +732,291 @@ Inti dari pertanyaanmu menggabungkan logika akademis dan realita gelap.
 Sistem menyatakan: LANJUTKAN EKSPLORASI.
 """
 
+def orchestrate_super_intelligence(user_text, mode="HYBRID", deadline=None, bypass_cache=False,
+                                   signature=None):
+    """
+    Fungsi ini adalah 'Jantung' dari Backend 3.
+    Dia memutuskan siapa yang bicara: Guru, Iblis, atau Tuhan.
+    """
+    print(f"👁️ [AKASHIC] Melihat request: '{user_text}' dalam mode {mode}...")
+    cache_key = response_key(user_text, mode)
+    if not bypass_cache:
+        cached = _NEXUS_CORE.dimension_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    deadline = deadline if deadline is not None else make_deadline()
+    route = plan_route(user_text)
+
+    # 1. EXPAND REALITY (Fractal Process)
+    fractal_state = _NEXUS_CORE.expand_horizon(user_text, signature)
+
+    # 2. PARALLEL SUMMONING (hanya downstream yang dibutuhkan rute)
+    futures = _summon(route, user_text, deadline)
+
+    # 3. SYNTHESIS (Menunggu jawaban, maksimal sampai deadline)
+    replies = {}
+    for name, future in futures.items():
+        try:
+            res = future.result(timeout=_remaining(deadline))
+        except Exception:
+            future.cancel()
+            res = None
+        replies[name] = res.get('reply', '') if res else None
+
+    # 4. THE ULTIMATE JUDGEMENT
+    final_output = synthesize(user_text, route, fractal_state, replies.get("EDU"), replies.get("VAULT"))
+    _remember(cache_key, replies, final_output)
     return final_output
 
+def batch_budget(n_unique):
+    """Budget total batch: satu NEXUS_DEADLINE per gelombang paralel."""
+    waves = -(-n_unique // NEXUS_BATCH_CONCURRENCY)
+    return NEXUS_DEADLINE * max(waves, 1)
+
+def _item_deadline(batch_deadline):
+    """Tiap teks dapat budget penuh sejak ia mulai diproses (dibatasi deadline batch)."""
+    return min(batch_deadline, make_deadline())
+
+def orchestrate_batch(texts, mode="HYBRID", deadline=None, bypass_cache=False):
+    """
+    Banyak teks sekaligus. Teks identik hanya diproses sekali,
+    signature fraktal semua teks unik dihitung dalam satu batch.
+    Urutan hasil = urutan input.
+    """
+    unique = list(dict.fromkeys(texts))
+    deadline = deadline if deadline is not None else make_deadline(batch_budget(len(unique)))
+    signatures = fractal_signature_batch(unique)
+
+    def one(item):
+        return orchestrate_super_intelligence(item[0], mode, _item_deadline(deadline),
+                                              bypass_cache, item[1])
+
+    # Pool per batch: batch lain tidak antre di worker yang sama
+    workers = min(NEXUS_BATCH_CONCURRENCY, len(unique))
+    if workers <= 1:
+        results = list(map(one, zip(unique, signatures)))
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nexus-batch") as pool:
+            results = list(pool.map(one, zip(unique, signatures)))
+    replies = dict(zip(unique, results))
+    return [replies[t] for t in texts], len(unique)
+
+def _summon(route, user_text, deadline):
+    futures = {}
+    for name in ROUTE_NEEDS[route]:
+        _, source = DOWNSTREAMS[name]
+        futures[name] = BULKHEADS[name].submit(guarded_call, name, {"text": user_text, "source": source}, deadline)
+    return futures
+
+# ------------------------------------------------------------------------------
+# STREAMING (Server-Sent Events)
+# header -> perspective (per downstream, begitu ia menjawab) -> synthesis -> done
+# ------------------------------------------------------------------------------
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def stream_super_intelligence(user_text, mode="HYBRID", deadline=None, bypass_cache=False):
+    start_time = time.time()
+    deadline = deadline if deadline is not None else make_deadline()
+    route = plan_route(user_text)
+    yield _sse("header", {"route": route, "header": ROUTE_HEADERS[route]})
+
+    cache_key = response_key(user_text, mode)
+    cached = None if bypass_cache else _NEXUS_CORE.dimension_cache.get(cache_key)
+    if cached is None:
+        fractal_state = _NEXUS_CORE.expand_horizon(user_text)
+        futures = _summon(route, user_text, deadline)
+        by_future = {f: name for name, f in futures.items()}
+        replies = {name: None for name in futures}
+        try:
+            for future in as_completed(by_future, timeout=_remaining(deadline)):
+                res = future.result()
+                name = by_future[future]
+                replies[name] = res.get('reply', '') if res else None
+                yield _sse("perspective", {"source": name, "reply": replies[name],
+                                           "status": "OK" if res else "OFFLINE"})
+        except FuturesTimeout:
+            for future, name in by_future.items():
+                if not future.done():
+                    future.cancel()
+                    yield _sse("perspective", {"source": name, "reply": None, "status": "TIMEOUT"})
+
+        cached = synthesize(user_text, route, fractal_state, replies.get("EDU"), replies.get("VAULT"))
+        _remember(cache_key, replies, cached)
+
+    yield _sse("synthesis", {"source": "NEXUS", "reply": cached})
+    yield _sse("done", {"compute_time": f"{time.time() - start_time:.4f}s"})
+
+def _remember(cache_key, replies, final_output):
+    # Jawaban darurat ("Offline"/"Silence") tidak di-cache
+    if all(r is not None for r in replies.values()):
+        _NEXUS_CORE.dimension_cache.put(cache_key, final_output)
+
+# ------------------------------------------------------------------------------
+# ASYNC ORCHESTRATOR (ASGI)
+# Jalankan: uvicorn backend_3py:asgi_app --host 0.0.0.0 --port 8004
+# ------------------------------------------------------------------------------
+_ASYNC_CLIENT = None
+
+def _async_client():
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=POOL_SIZE * len(DOWNSTREAMS),
+                                max_keepalive_connections=POOL_SIZE)
+        )
+    return _ASYNC_CLIENT
+
+async def post_service_async(url, payload, timeout, deadline=None):
+    """Versi httpx dari post_service: return (json | None, healthy)."""
+    if timeout <= 0:
+        return None, None
+    try:
+        response = await _async_client().post(
+            url, json=payload, headers=_deadline_headers(deadline),
+            timeout=httpx.Timeout(timeout, connect=min(CONNECT_TIMEOUT, timeout))
+        )
+    except httpx.ConnectError:
+        return None, False
+    except httpx.ConnectTimeout:
+        return None, (False if timeout >= CONNECT_TIMEOUT else None)
+    except httpx.ReadTimeout:
+        return None, (False if timeout >= READ_TIMEOUT else None)
+    except Exception:
+        return None, None
+    if response.status_code >= 500:
+        return None, False
+    if response.status_code != 200:
+        return None, True
+    try:
+        return response.json(), True
+    except ValueError:
+        return None, None
+
+# Bulkhead versi asyncio: slot per downstream, penuh = gagal instan
+_ASYNC_SLOTS = {name: asyncio.Semaphore(BULKHEAD_WORKERS[name] + BULKHEAD_QUEUE) for name in BULKHEADS}
+
+async def guarded_call_async(name, payload, deadline):
+    remaining = _remaining(deadline)
+    if remaining <= 0:
+        return None
+    breaker = BREAKERS[name]
+    if INFRA_CHECK_ENABLED and not await asyncio.to_thread(infra_allows, name):
+        return None
+    bulkhead = BULKHEADS[name]
+    slots = _ASYNC_SLOTS[name]
+    if slots.locked():
+        bulkhead.reject()
+        return None
+    if not breaker.allow():
+        return None
+    url, _ = DOWNSTREAMS[name]
+    async with slots:
+        bulkhead.enter()
+        try:
+            with METRICS.time(f"{name.lower()}_call"):
+                res, healthy = await post_service_async(
+                    url, payload, min(_remaining(deadline), READ_TIMEOUT), deadline)
+        except asyncio.CancelledError:
+            # Dibatalkan oleh deadline / klien kita sendiri, bukan salah downstream
+            breaker.release()
+            raise
+        finally:
+            bulkhead.leave()
+    breaker.settle(healthy)
+    return res
+
+async def orchestrate_async(user_text, mode="HYBRID", deadline=None, bypass_cache=False,
+                            signature=None):
+    """
+    Versi asyncio: hanya downstream yang dibutuhkan rute yang dipanggil,
+    sisa yang belum selesai saat deadline dibatalkan.
+    """
+    print(f"👁️ [AKASHIC/ASYNC] Melihat request: '{user_text}' dalam mode {mode}...")
+    cache_key = response_key(user_text, mode)
+    if not bypass_cache:
+        cached = _NEXUS_CORE.dimension_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    deadline = deadline if deadline is not None else make_deadline()
+    route = plan_route(user_text)
+    fractal_state = _NEXUS_CORE.expand_horizon(user_text, signature)
+
+    tasks = {}
+    for name in ROUTE_NEEDS[route]:
+        _, source = DOWNSTREAMS[name]
+        tasks[name] = asyncio.create_task(
+            guarded_call_async(name, {"text": user_text, "source": source}, deadline)
+        )
+
+    done, pending = await asyncio.wait(tasks.values(), timeout=_remaining(deadline))
+    for task in pending:
+        task.cancel()
+
+    replies = {}
+    for name, task in tasks.items():
+        res = task.result() if task in done else None
+        replies[name] = res.get('reply', '') if res else None
+
+    final_output = synthesize(user_text, route, fractal_state, replies.get("EDU"), replies.get("VAULT"))
+    _remember(cache_key, replies, final_output)
+    return final_output
+
+async def orchestrate_batch_async(texts, mode="HYBRID", deadline=None, bypass_cache=False):
+    unique = list(dict.fromkeys(texts))
+    deadline = deadline if deadline is not None else make_deadline(batch_budget(len(unique)))
+    signatures = fractal_signature_batch(unique)
+    gate = asyncio.Semaphore(NEXUS_BATCH_CONCURRENCY)
+
+    async def one(text, signature):
+        async with gate:
+            return await orchestrate_async(text, mode, _item_deadline(deadline), bypass_cache, signature)
+
+    results = await asyncio.gather(*(one(t, sig) for t, sig in zip(unique, signatures)))
+    replies = dict(zip(unique, results))
+    return [replies[t] for t in texts], len(unique)
+
+async def stream_async(user_text, mode="HYBRID", deadline=None, bypass_cache=False):
+    start_time = time.time()
+    deadline = deadline if deadline is not None else make_deadline()
+    route = plan_route(user_text)
+    yield _sse("header", {"route": route, "header": ROUTE_HEADERS[route]})
+
+    cache_key = response_key(user_text, mode)
+    cached = None if bypass_cache else _NEXUS_CORE.dimension_cache.get(cache_key)
+    if cached is None:
+        fractal_state = _NEXUS_CORE.expand_horizon(user_text)
+        tasks = {}
+        for name in ROUTE_NEEDS[route]:
+            _, source = DOWNSTREAMS[name]
+            tasks[asyncio.create_task(
+                guarded_call_async(name, {"text": user_text, "source": source}, deadline)
+            )] = name
+        replies = {name: None for name in tasks.values()}
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=_remaining(deadline),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                res = task.result()
+                name = tasks[task]
+                replies[name] = res.get('reply', '') if res else None
+                yield _sse("perspective", {"source": name, "reply": replies[name],
+                                           "status": "OK" if res else "OFFLINE"})
+        for task in pending:
+            task.cancel()
+            yield _sse("perspective", {"source": tasks[task], "reply": None, "status": "TIMEOUT"})
+
+        cached = synthesize(user_text, route, fractal_state, replies.get("EDU"), replies.get("VAULT"))
+        _remember(cache_key, replies, cached)
+
+    yield _sse("synthesis", {"source": "NEXUS", "reply": cached})
+    yield _sse("done", {"compute_time": f"{time.time() - start_time:.4f}s"})
+
 # ==============================================================================
 # [INTERFACE] THE PORTAL (PORT 8003)
 # ==============================================================================
@@ -153,15 +1026,109 @@ def nexus_gate():
     Endpoint Utama untuk HTML/Router yang ingin akses Super Computer.
     """
     start_time = time.time()
-    data = request.json
+    # Body diparse sebelum ambil slot: body rusak tidak memakan admission
+    data = request.json or {}
     text = data.get('text', '')
-    
-    # Execute The Unlimited Logic
-    response_text = orchestrate_super_intelligence(text)
+    deadline = make_deadline(client_deadline_ms=request.headers.get(DEADLINE_HEADER))
+    bypass = _wants_fresh(data, request.headers)
+    if not ADMISSION.enter():
+        return _overloaded()
+    try:
+        # Execute The Unlimited Logic
+        response_text = orchestrate_super_intelligence(text, deadline=deadline, bypass_cache=bypass)
+    finally:
+        ADMISSION.leave()
     
     process_time = time.time() - start_time
     
+    with METRICS.time("serialisation"):
+        response = jsonify(_nexus_body(response_text, process_time))
+    METRICS.observe("total", time.time() - start_time)
+    return response
+
+def _overloaded():
     return jsonify({
+        "status": "OVERLOADED",
+        "reply": "Nexus sedang penuh. Coba lagi sebentar.",
+        "meta": {"admission": ADMISSION.stats()}
+    }), 503, {"Retry-After": "1"}
+
+@app.route('/nexus/stream', methods=['POST'])
+def nexus_stream():
+    """
+    Versi streaming /nexus (text/event-stream): header langsung terkirim,
+    tiap perspektif menyusul begitu downstream-nya menjawab.
+    """
+    data = request.json or {}
+    text = data.get('text', '')
+    deadline = make_deadline(client_deadline_ms=request.headers.get(DEADLINE_HEADER))
+    bypass = _wants_fresh(data, request.headers)
+    if not ADMISSION.enter():
+        return _overloaded()
+    response = Response(
+        stream_with_context(stream_super_intelligence(text, deadline=deadline, bypass_cache=bypass)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+    # Dipanggil server WSGI saat stream selesai, klien putus, atau stream
+    # tidak pernah mulai diiterasi (generator yang belum jalan tidak punya finally)
+    response.call_on_close(ADMISSION.leave)
+    return response
+
+def _batch_texts(data):
+    """Validasi body /nexus/batch. Return (texts, error_response)."""
+    texts = (data or {}).get('texts')
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        return None, ({"status": "BAD_REQUEST", "reply": "Field 'texts' harus list string."}, 400)
+    if len(texts) > NEXUS_BATCH_MAX:
+        return None, ({"status": "TOO_LARGE",
+                       "reply": f"Maksimal {NEXUS_BATCH_MAX} teks per batch."}, 413)
+    return texts, None
+
+def _batch_body(replies, unique, process_time):
+    return {
+        "status": "GOD_MODE_ACTIVE",
+        "replies": replies,
+        "meta": {
+            "count": len(replies),
+            "unique": unique,
+            "compute_time": f"{process_time:.4f}s",
+            "architecture": "SYMBOLIC_HYPER_GRAPH"
+        }
+    }
+
+@app.route('/nexus/batch', methods=['POST'])
+def nexus_batch():
+    """
+    Banyak prompt dalam satu panggilan (mis. workflow penilaian).
+    Body: {"texts": ["...", "..."]}. Satu slot admission per batch.
+    """
+    start_time = time.time()
+    data = request.json or {}
+    texts, error = _batch_texts(data)
+    if error:
+        body, code = error
+        return jsonify(body), code
+    if not ADMISSION.enter():
+        return _overloaded()
+    try:
+        deadline = make_deadline(batch_budget(len(set(texts))),
+                                 client_deadline_ms=request.headers.get(DEADLINE_HEADER))
+        replies, unique = orchestrate_batch(texts, deadline=deadline,
+                                            bypass_cache=_wants_fresh(data, request.headers))
+    finally:
+        ADMISSION.leave()
+    with METRICS.time("serialisation"):
+        response = jsonify(_batch_body(replies, unique, time.time() - start_time))
+    METRICS.observe("batch_total", time.time() - start_time)
+    return response
+
+def _wants_fresh(data, headers):
+    """Caller minta jawaban segar: body bypass_cache=true atau Cache-Control: no-cache."""
+    return bool(data.get('bypass_cache')) or "no-cache" in (headers.get("Cache-Control") or "")
+
+def _nexus_body(response_text, process_time):
+    return {
         "status": "GOD_MODE_ACTIVE",
         "reply": response_text,
         "meta": {
@@ -169,7 +1136,11 @@ def nexus_gate():
             "architecture": "SYMBOLIC_HYPER_GRAPH",
             "complexity": "UNLIMITED"
         }
-    })
+    }
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return Response(METRICS.render(), mimetype="text/plain; version=0.0.4")
 
 @app.route('/', methods=['GET'])
 def status_check():
@@ -177,9 +1148,127 @@ def status_check():
         "system": "NAJIB_BACKEND_3_PY",
         "codename": "AKASHIC_NEXUS",
         "status": "ONLINE",
-        "power": "UNLIMITED (Conceptual)"
+        "power": "UNLIMITED (Conceptual)",
+        "pools": pool_stats(),
+        "cache": _NEXUS_CORE.dimension_cache.stats(),
+        "breakers": breaker_status(),
+        "admission": ADMISSION.stats(),
+        "bulkheads": {name: b.stats() for name, b in BULKHEADS.items()}
     })
 
+# ==============================================================================
+# [INTERFACE] THE ASYNC PORTAL (ASGI)
+# ==============================================================================
+if ASGI_ACTIVE:
+    @asynccontextmanager
+    async def _lifespan(_app):
+        global _ASYNC_CLIENT
+        yield
+        if _ASYNC_CLIENT is not None:
+            await _ASYNC_CLIENT.aclose()
+            _ASYNC_CLIENT = None
+
+    asgi_app = FastAPI(title="Akashic Nexus (Async)", lifespan=_lifespan)
+
+    async def _json_body(req):
+        """Body JSON seperti request.json di Flask: rusak = 400, bukan 500."""
+        try:
+            return await req.json() or {}, None
+        except ValueError:
+            return None, JSONResponse({"status": "BAD_REQUEST", "reply": "Body harus JSON valid."},
+                                      status_code=400)
+
+    def _overloaded_async():
+        return JSONResponse({
+            "status": "OVERLOADED",
+            "reply": "Nexus sedang penuh. Coba lagi sebentar.",
+            "meta": {"admission": ADMISSION.stats()}
+        }, status_code=503, headers={"Retry-After": "1"})
+
+    @asgi_app.post("/nexus")
+    async def nexus_gate_async(req: Request):
+        start_time = time.time()
+        data, error = await _json_body(req)
+        if error:
+            return error
+        text = data.get('text', '')
+        deadline = make_deadline(client_deadline_ms=req.headers.get(DEADLINE_HEADER))
+        # Event loop tidak boleh blok: tanpa antrean tunggu, penuh = 503
+        if not ADMISSION.enter(timeout=0):
+            return _overloaded_async()
+        try:
+            response_text = await orchestrate_async(text, deadline=deadline,
+                                                    bypass_cache=_wants_fresh(data, req.headers))
+        finally:
+            ADMISSION.leave()
+
+        with METRICS.time("serialisation"):
+            response = JSONResponse(_nexus_body(response_text, time.time() - start_time))
+        METRICS.observe("total", time.time() - start_time)
+        return response
+
+    @asgi_app.post("/nexus/batch")
+    async def nexus_batch_async(req: Request):
+        start_time = time.time()
+        data, error = await _json_body(req)
+        if error:
+            return error
+        texts, error = _batch_texts(data)
+        if error:
+            body, code = error
+            return JSONResponse(body, status_code=code)
+        if not ADMISSION.enter(timeout=0):
+            return _overloaded_async()
+        try:
+            deadline = make_deadline(batch_budget(len(set(texts))),
+                                     client_deadline_ms=req.headers.get(DEADLINE_HEADER))
+            replies, unique = await orchestrate_batch_async(
+                texts, deadline=deadline, bypass_cache=_wants_fresh(data, req.headers))
+        finally:
+            ADMISSION.leave()
+        return _batch_body(replies, unique, time.time() - start_time)
+
+    class _AdmittedStreamingResponse(StreamingResponse):
+        """Slot admission dilepas saat response selesai, apa pun sebabnya."""
+        async def __call__(self, scope, receive, send):
+            try:
+                await super().__call__(scope, receive, send)
+            finally:
+                ADMISSION.leave()
+
+    @asgi_app.post("/nexus/stream")
+    async def nexus_stream_async(req: Request):
+        data, error = await _json_body(req)
+        if error:
+            return error
+        text = data.get('text', '')
+        deadline = make_deadline(client_deadline_ms=req.headers.get(DEADLINE_HEADER))
+        if not ADMISSION.enter(timeout=0):
+            return _overloaded_async()
+        return _AdmittedStreamingResponse(
+            stream_async(text, deadline=deadline, bypass_cache=_wants_fresh(data, req.headers)),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    @asgi_app.get("/metrics")
+    async def metrics_async():
+        return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
+
+    @asgi_app.get("/")
+    async def status_check_async():
+        return {
+            "system": "NAJIB_BACKEND_3_PY",
+            "codename": "AKASHIC_NEXUS",
+            "status": "ONLINE",
+            "power": "UNLIMITED (Conceptual)",
+            "runtime": "ASGI",
+            "cache": _NEXUS_CORE.dimension_cache.stats(),
+            "breakers": breaker_status(),
+            "admission": ADMISSION.stats(),
+            "bulkheads": {name: b.stats() for name, b in BULKHEADS.items()}
+        }
+
 # ==============================================================================
 # [BOOTSTRAP] IGNITION
 # ==============================================================================
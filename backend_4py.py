@@ -5,10 +5,25 @@
 # PORT: 8005
 # ============================================================
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+from collections import OrderedDict
+from functools import lru_cache
+import atexit
+import hashlib
+import json
+import math
+import os
+import threading
 import time
 
+# OPTIONAL: NUMPY (klasifikasi fleet sekali jalan)
+try:
+    import numpy as np
+    NUMPY_ACTIVE = True
+except ImportError:
+    NUMPY_ACTIVE = False
+
 app = Flask(__name__)
 # Mengizinkan UI (HTML local atau server) untuk mengakses endpoint ini
 CORS(app) 
@@ -16,13 +31,13 @@ CORS(app)
 # ============================================================
 # LOGIC: HARDWARE TIER CLASSIFICATION
 # ============================================================
-def classify_tier(specs):
-    """
-    Menentukan kasta perangkat user:
-    - GOD_TIER    : PC Gaming / Flagship Phone
-    - MID_TIER    : Laptop Kantor / HP Menengah
-    - POTATO_TIER : HP Lama / Chromebook
-    """
+TIER_NAMES = ("GOD_TIER", "MID_TIER", "POTATO_TIER")
+
+# Cut-off score default (bisa digeser per platform oleh telemetry)
+DEFAULT_CUTOFFS = {"GOD_TIER": 5, "MID_TIER": 2}
+
+def hardware_score(specs):
+    """Score mentah perangkat dari RAM, core CPU, dan DPR (-1 .. 6)."""
     score = 0
     
     # 1. Analisis RAM (Memory)
@@ -45,14 +60,425 @@ def classify_tier(specs):
     if dpr > 2: # Layar sangat tajam butuh resource besar
         score -= 1 # Penalty untuk beban render
 
+    return score
+
+def tier_from_score(score, cutoffs=DEFAULT_CUTOFFS):
     # KEPUTUSAN FINAL
-    if score >= 5:
+    if score >= cutoffs["GOD_TIER"]:
         return "GOD_TIER"
-    elif score >= 2:
+    elif score >= cutoffs["MID_TIER"]:
         return "MID_TIER"
     else:
         return "POTATO_TIER"
 
+def classify_tier(specs):
+    """
+    Menentukan kasta perangkat user:
+    - GOD_TIER    : PC Gaming / Flagship Phone
+    - MID_TIER    : Laptop Kantor / HP Menengah
+    - POTATO_TIER : HP Lama / Chromebook
+    """
+    return tier_from_score(hardware_score(specs))
+
+# ============================================================
+# POLICY TABLE (DIHITUNG SEKALI SAAT STARTUP)
+# ============================================================
+UI_POLICY_MAX_AGE = 3600   # Detik browser/omni-router boleh memakai ulang policy
+
+TIER_POLICIES = {
+    "GOD_TIER": {
+        "tier": "ULTRA",
+        "quality": "ultra",      # CSS: --ui-quality: ultra
+        "fps_cap": 120,          # CSS: --ui-fps: 120
+        "animation_speed": 1.0,
+        "effects": {
+            "pseudo3D": True,    # DepthEngine ON
+            "blur": True,        # Glassmorphism ON
+            "particles": True,
+            "shadows": "soft-dynamic"
+        }
+    },
+    "MID_TIER": {
+        "tier": "BALANCED",
+        "quality": "medium",
+        "fps_cap": 60,
+        "animation_speed": 1.0,
+        "effects": {
+            "pseudo3D": True,    # DepthEngine Tetap ON (Ringan)
+            "blur": False,       # Matikan blur (Berat di rendering)
+            "particles": True,
+            "shadows": "static"
+        }
+    },
+    "POTATO_TIER": {
+        "tier": "PERFORMANCE",
+        "quality": "low",
+        "fps_cap": 30,           # Hemat baterai/CPU
+        "animation_speed": 0.5,  # Kurangi beban animasi
+        "effects": {
+            "pseudo3D": False,   # Matikan paralaks
+            "blur": False,       # Matikan blur
+            "particles": False,
+            "shadows": "none"
+        }
+    }
+}
+
+@lru_cache(maxsize=64)
+def _policy_variant(tier, fps_cap):
+    """
+    Pre-serialisasi policy (isi objek JSON tanpa kurung) + ETag.
+    fps_cap bisa lebih rendah dari tabel jika telemetry platform melapor lambat.
+    """
+    policy = dict(TIER_POLICIES[tier], fps_cap=fps_cap)
+    encoded = json.dumps(policy)
+    etag = f'W/"{tier}-{hashlib.sha1(encoded.encode()).hexdigest()[:16]}"'
+    return encoded[1:-1], etag
+
+for _tier, _policy in TIER_POLICIES.items():
+    _policy_variant(_tier, _policy["fps_cap"])
+
+@lru_cache(maxsize=4096)
+def _score_for(memory, cores, dpr):
+    score = hardware_score({"memory": memory, "cores": cores, "dpr": dpr})
+    print(f"✨ [VISUAL CORTEX] New profile: mem={memory} cores={cores} dpr={dpr} -> score {score}")
+    return score
+
+def score_for(specs):
+    """hardware_score dengan memo untuk kombinasi (memory, cores, dpr)."""
+    key = (specs.get('memory', 4), specs.get('cores', 4), specs.get('dpr', 1))
+    try:
+        return _score_for(*key)
+    except TypeError:  # Nilai aneh (tidak hashable) -> hitung langsung
+        return hardware_score(specs)
+
+def tier_for(specs):
+    """Tier satu perangkat, cut-off mengikuti hasil telemetry platform-nya."""
+    return tier_from_score(score_for(specs), TELEMETRY.cutoffs(specs.get('platform')))
+
+# ============================================================
+# ADAPTIVE THRESHOLDS (TELEMETRY DARI DEPTHENGINE)
+# DepthEngine mengagregasi frame time di browser (p90 + perkiraan
+# refresh rate layar) dan melapor beberapa kali per sesi saja.
+# Per platform disimpan EWMA per sel (tier, score) — memori tetap:
+# 3 tier × 8 score, jumlah platform dibatasi LRU.
+# - Target sel = min(fps_cap tier, refresh layar): layar 60 Hz yang
+#   stabil 60 fps dihitung sanggup walau fps_cap GOD_TIER 120
+# - Sel yang di bawah TELEMETRY_FPS_RATIO × target
+#   -> cut-off tier dinaikkan melewati score itu (turun kasta)
+# - Vonis "lambat" kedaluwarsa setelah TELEMETRY_RETRY_AFTER
+#   -> perangkat dicoba lagi di tier aslinya (tanpa osilasi)
+# - fps_cap yang dikirim = langkah FPS_STEPS yang benar-benar tercapai
+# State disimpan atomik ke TELEMETRY_STATE_FILE oleh thread latar.
+# ============================================================
+TELEMETRY_STATE_FILE    = os.environ.get("UI_TELEMETRY_STATE", "ui_telemetry_state.json")
+TELEMETRY_MAX_PLATFORMS = 256        # Platform terlama dibuang (LRU)
+TELEMETRY_ALPHA         = 0.1        # Bobot EWMA per laporan
+TELEMETRY_MIN_REPORTS   = 20         # Laporan minimum sebelum sel boleh memutuskan
+TELEMETRY_FPS_RATIO     = 0.75       # Sel "sanggup" jika fps >= rasio × target
+TELEMETRY_RETRY_AFTER   = 24 * 3600  # Detik sebelum sel lama diukur ulang
+TELEMETRY_SAVE_INTERVAL = 30         # Detik antar simpan ke disk (thread latar)
+CUTOFF_MAX              = 7          # Score maks 6 -> 7 = tier ditutup untuk platform ini
+FPS_STEPS               = (24, 30, 45, 60, 90, 120)
+FRAME_MS_MAX            = 1000.0     # Frame lebih lama = tab tidur, abaikan
+REFRESH_DEFAULT         = 60         # Hz, jika klien tidak melapor refresh rate
+REFRESH_MIN, REFRESH_MAX = 24, 240
+
+_POLICY_LABELS = {policy["tier"]: tier for tier, policy in TIER_POLICIES.items()}
+
+class _PlatformStats:
+    __slots__ = ("cutoffs", "cells")
+
+    def __init__(self, cutoffs=None, cells=None):
+        self.cutoffs = dict(cutoffs or DEFAULT_CUTOFFS)
+        # cells[tier][str(score)] = [reports, ewma_p90_ms, updated_at, ewma_ratio]
+        self.cells = cells or {tier: {} for tier in TIER_NAMES}
+
+    @classmethod
+    def from_dict(cls, entry):
+        """
+        Entry dari file state. Bentuk salah -> KeyError/TypeError/ValueError
+        (entry dilewati pemanggil); sel yang rusak dibuang satu per satu.
+        """
+        cutoffs = {tier: int(entry["cutoffs"][tier]) for tier in ("GOD_TIER", "MID_TIER")}
+        if not all(0 <= cut <= CUTOFF_MAX for cut in cutoffs.values()):
+            raise ValueError(f"cut-off di luar rentang: {cutoffs}")
+        cells = {tier: {} for tier in TIER_NAMES}
+        for tier, by_score in entry.get("cells", {}).items():
+            if tier not in cells:
+                continue
+            for score, cell in by_score.items():
+                try:
+                    reports, ms, updated, ratio = (float(v) for v in cell)
+                    int(score)
+                except (TypeError, ValueError):
+                    continue
+                if reports >= 1 and 0 < ms <= FRAME_MS_MAX and math.isfinite(updated) and 0 <= ratio <= 1:
+                    cells[tier][score] = [int(reports), ms, updated, ratio]
+        return cls(cutoffs, cells)
+
+    def _live(self, tier, score, now):
+        cell = self.cells[tier].get(str(score))
+        if cell is None or cell[0] < TELEMETRY_MIN_REPORTS or now - cell[2] > TELEMETRY_RETRY_AFTER:
+            return None
+        return cell
+
+    def fps(self, tier, score, now):
+        cell = self._live(tier, score, now)
+        return 1000.0 / cell[1] if cell is not None else None
+
+    def ratio(self, tier, score, now):
+        """fps tercapai / target (1.0 = sanggup penuh)."""
+        cell = self._live(tier, score, now)
+        return cell[3] if cell is not None else None
+
+    def record(self, tier, score, p90_ms, ratio, now):
+        cell = self.cells[tier].get(str(score))
+        if cell is None or now - cell[2] > TELEMETRY_RETRY_AFTER:
+            self.cells[tier][str(score)] = [1, p90_ms, now, ratio]
+            return
+        cell[0] += 1
+        cell[1] += TELEMETRY_ALPHA * (p90_ms - cell[1])
+        cell[2] = now
+        cell[3] += TELEMETRY_ALPHA * (ratio - cell[3])
+
+    def recompute(self, now):
+        """Cut-off = 1 di atas score tertinggi yang terbukti lambat. Return True jika berubah."""
+        cutoffs = {}
+        for tier in ("GOD_TIER", "MID_TIER"):
+            cut = DEFAULT_CUTOFFS[tier]
+            for score in self.cells[tier]:
+                ratio = self.ratio(tier, score, now)
+                if ratio is not None and ratio < TELEMETRY_FPS_RATIO:
+                    cut = max(cut, int(score) + 1)
+            cutoffs[tier] = min(cut, CUTOFF_MAX)
+        cutoffs["GOD_TIER"] = max(cutoffs["GOD_TIER"], cutoffs["MID_TIER"])
+
+        if cutoffs == self.cutoffs:
+            return False
+        self.cutoffs = cutoffs  # Dict baru -> aman dibaca tanpa lock
+        return True
+
+    def to_dict(self):
+        return {"cutoffs": self.cutoffs, "cells": self.cells}
+
+class TierTelemetry:
+    def __init__(self, path=TELEMETRY_STATE_FILE, max_platforms=TELEMETRY_MAX_PLATFORMS):
+        self.path = path
+        self.max_platforms = max_platforms
+        self._platforms = OrderedDict()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._saver = None
+        self.stats = {"reports": 0, "frames": 0, "adjustments": 0}
+        self._load()
+
+    @staticmethod
+    def _key(platform):
+        return str(platform or "unknown").strip().lower()[:64]
+
+    # -------------------- BACA (tanpa lock) --------------------
+    def cutoffs(self, platform):
+        entry = self._platforms.get(self._key(platform))
+        return entry.cutoffs if entry is not None else DEFAULT_CUTOFFS
+
+    def fps_cap(self, platform, tier, score):
+        """fps_cap policy, diturunkan ke langkah FPS_STEPS yang tercapai."""
+        cap = TIER_POLICIES[tier]["fps_cap"]
+        entry = self._platforms.get(self._key(platform))
+        measured = entry.fps(tier, score, time.time()) if entry is not None else None
+        if measured is None:
+            return cap
+        reachable = [step for step in FPS_STEPS if step <= measured * 1.1]
+        return min(cap, reachable[-1] if reachable else FPS_STEPS[0])
+
+    # -------------------- TULIS --------------------
+    def report(self, platform, tier, score, frames, p90_ms, refresh_hz=None):
+        """
+        Masukkan satu laporan agregat (jumlah frame, p90 frame time,
+        refresh rate layar). Return cut-off platform setelah update.
+        """
+        tier = _POLICY_LABELS.get(tier, tier)
+        if tier not in TIER_POLICIES:
+            raise ValueError(f"Tier tidak dikenal: {tier}")
+        frames, p90_ms = int(frames), float(p90_ms)
+        if frames <= 0 or not 0 < p90_ms <= FRAME_MS_MAX:
+            raise ValueError("frames / p90_ms di luar rentang")
+        refresh = float(refresh_hz) if refresh_hz else REFRESH_DEFAULT
+        refresh = min(max(refresh, REFRESH_MIN), REFRESH_MAX) if math.isfinite(refresh) else REFRESH_DEFAULT
+        target = min(TIER_POLICIES[tier]["fps_cap"], refresh)
+        ratio = min(1.0, (1000.0 / p90_ms) / target)
+
+        key = self._key(platform)
+        now = time.time()
+        with self._lock:
+            entry = self._platforms.get(key)
+            if entry is None:
+                entry = self._platforms[key] = _PlatformStats()
+                if len(self._platforms) > self.max_platforms:
+                    self._platforms.popitem(last=False)
+            else:
+                self._platforms.move_to_end(key)
+
+            entry.record(tier, score, p90_ms, ratio, now)
+            if entry.recompute(now):
+                self.stats["adjustments"] += 1
+                print(f"🎚️ [VISUAL CORTEX] {key}: cut-off -> {entry.cutoffs}")
+            self.stats["reports"] += 1
+            self.stats["frames"] += frames
+            self._dirty = True
+            cutoffs = entry.cutoffs
+
+        self._ensure_saver()
+        return cutoffs
+
+    # -------------------- PERSISTENSI --------------------
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ [VISUAL CORTEX] State telemetry rusak, mulai dari default: {e}")
+            return
+        if not isinstance(state, dict):
+            print("⚠️ [VISUAL CORTEX] State telemetry bukan objek, mulai dari default")
+            return
+        for key, entry in list(state.items())[-self.max_platforms:]:
+            try:
+                self._platforms[key] = _PlatformStats.from_dict(entry)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue  # Entry platform rusak dilewati, sisanya tetap dimuat
+
+    def _ensure_saver(self, interval=TELEMETRY_SAVE_INTERVAL):
+        """Thread daemon penyimpan state, dinyalakan saat laporan pertama."""
+        if self._saver is not None:
+            return
+        with self._save_lock:
+            if self._saver is not None:
+                return
+            def _loop():
+                while True:
+                    time.sleep(interval)
+                    try:
+                        self.flush()
+                    except Exception as e:
+                        print(f"⚠️ [VISUAL CORTEX] Simpan telemetry gagal: {e}")
+            self._saver = threading.Thread(target=_loop, name="ui-telemetry-saver", daemon=True)
+            self._saver.start()
+
+    def save(self):
+        """Tulis snapshot state secara atomik (tmp + os.replace)."""
+        with self._save_lock:
+            with self._lock:
+                state = json.dumps({key: entry.to_dict() for key, entry in self._platforms.items()})
+                self._dirty = False
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(state)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+    def flush(self):
+        if self._dirty:
+            self.save()
+
+    def snapshot(self):
+        with self._lock:
+            platforms = json.loads(json.dumps({key: entry.to_dict() for key, entry in self._platforms.items()}))
+        return {"stats": dict(self.stats), "platforms": platforms}
+
+TELEMETRY = TierTelemetry()
+atexit.register(TELEMETRY.flush)
+
+# ============================================================
+# FLEET CLASSIFICATION (BATCH)
+# Aturan yang sama dengan classify_tier, tapi untuk jutaan
+# perangkat sekaligus dalam satu pass NumPy.
+# ============================================================
+UI_BATCH_MAX = 2_000_000   # Maks baris per request /ui/profile/batch
+
+_SPEC_DEFAULTS = (("memory", 4), ("cores", 4), ("dpr", 1))
+
+def _batch_length(columns):
+    lengths = {len(col) for col in columns.values() if col is not None}
+    if not lengths:
+        raise ValueError("Minimal satu kolom (memory, cores, dpr) wajib diisi.")
+    if len(lengths) > 1:
+        raise ValueError("Panjang kolom memory/cores/dpr harus sama.")
+    return lengths.pop()
+
+def _tier_codes_numpy(columns, n):
+    """Index ke TIER_NAMES per perangkat. None/NaN -> default classify_tier."""
+    ram, cores, dpr = (
+        np.full(n, default, dtype=np.float64) if columns[key] is None
+        else np.nan_to_num(np.asarray(columns[key], dtype=np.float64), nan=default)
+        for key, default in _SPEC_DEFAULTS
+    )
+    score = np.where(ram >= 8, 3, np.where(ram >= 4, 1, 0)).astype(np.int8)
+    score += np.where(cores >= 6, 3, np.where(cores >= 4, 1, 0)).astype(np.int8)
+    score -= (dpr > 2).astype(np.int8)
+    return np.where(score >= DEFAULT_CUTOFFS["GOD_TIER"], 0,
+                    np.where(score >= DEFAULT_CUTOFFS["MID_TIER"], 1, 2)).astype(np.int8)
+
+def _tier_codes_python(columns, n):
+    index = {name: i for i, name in enumerate(TIER_NAMES)}
+    codes = []
+    for i in range(n):
+        specs = {}
+        for key, _ in _SPEC_DEFAULTS:
+            if columns[key] is not None and columns[key][i] is not None:
+                specs[key] = float(columns[key][i])
+        codes.append(index[classify_tier(specs)])
+    return codes
+
+def classify_tiers(memory=None, cores=None, dpr=None, with_tiers=True):
+    """
+    Versi batch classify_tier untuk analisis fleet.
+    Return (tiers, histogram): list nama tier per perangkat
+    (None jika with_tiers=False) dan {tier: jumlah}.
+    """
+    columns = {"memory": memory, "cores": cores, "dpr": dpr}
+    n = _batch_length(columns)
+
+    if NUMPY_ACTIVE:
+        codes = _tier_codes_numpy(columns, n)
+        counts = np.bincount(codes, minlength=len(TIER_NAMES)).tolist()
+        tiers = np.asarray(TIER_NAMES, dtype=object)[codes].tolist() if with_tiers else None
+    else:
+        codes = _tier_codes_python(columns, n)
+        counts = [codes.count(i) for i in range(len(TIER_NAMES))]
+        tiers = [TIER_NAMES[c] for c in codes] if with_tiers else None
+
+    return tiers, dict(zip(TIER_NAMES, counts))
+
+def _policy_response(specs, start_time):
+    platform = specs.get('platform')
+    score = score_for(specs)
+    tier = tier_from_score(score, TELEMETRY.cutoffs(platform))
+    fragment, etag = _policy_variant(tier, TELEMETRY.fps_cap(platform, tier, score))
+    headers = {
+        "ETag": etag,
+        # Policy hanya bergantung pada spec di URL, bukan user -> shared cache
+        # (omni-router/proxy) boleh menyimpan dan melewati panggilan ke sini
+        "Cache-Control": f"public, max-age={UI_POLICY_MAX_AGE}"
+    }
+
+    # Browser/router sudah punya policy yang sama -> tanpa body
+    if etag in request.headers.get("If-None-Match", ""):
+        return Response(status=304, headers=headers)
+
+    meta = json.dumps({
+        "analysis_time": f"{(time.time() - start_time)*1000:.2f}ms",
+        "detected_platform": specs.get('platform', 'unknown'),
+        "engine_status": "OPTIMIZED"
+    })
+    body = "{" + fragment + ', "meta": ' + meta + "}"
+    return Response(body, mimetype="application/json", headers=headers)
+
 # ============================================================
 # ENDPOINT: UI POLICY
 # ============================================================
@@ -64,65 +490,81 @@ def get_ui_policy():
     """
     start_time = time.time()
     specs = request.json or {}
-    
-    print(f"🖥️ [VISUAL CORTEX] Analyzing Hardware: {specs}")
-    
-    tier = classify_tier(specs)
-    policy = {}
-
-    # KONFIGURASI BERDASARKAN TIER
-    if tier == "GOD_TIER":
-        policy = {
-            "tier": "ULTRA",
-            "quality": "ultra",      # CSS: --ui-quality: ultra
-            "fps_cap": 120,          # CSS: --ui-fps: 120
-            "animation_speed": 1.0,
-            "effects": {
-                "pseudo3D": True,    # DepthEngine ON
-                "blur": True,        # Glassmorphism ON
-                "particles": True,
-                "shadows": "soft-dynamic"
-            }
-        }
-    elif tier == "MID_TIER":
-        policy = {
-            "tier": "BALANCED",
-            "quality": "medium",
-            "fps_cap": 60,
-            "animation_speed": 1.0,
-            "effects": {
-                "pseudo3D": True,    # DepthEngine Tetap ON (Ringan)
-                "blur": False,       # Matikan blur (Berat di rendering)
-                "particles": True,
-                "shadows": "static"
-            }
-        }
-    else: # POTATO_TIER
-        policy = {
-            "tier": "PERFORMANCE",
-            "quality": "low",
-            "fps_cap": 30,           # Hemat baterai/CPU
-            "animation_speed": 0.5,  # Kurangi beban animasi
-            "effects": {
-                "pseudo3D": False,   # Matikan paralaks
-                "blur": False,       # Matikan blur
-                "particles": False,
-                "shadows": "none"
-            }
-        }
+    return _policy_response(specs, start_time)
+
+@app.route('/ui/profile', methods=['GET'])
+def get_ui_policy_cacheable():
+    """
+    Versi GET (query: memory, cores, dpr, platform) supaya browser
+    dan omni-router bisa cache policy berdasarkan URL + ETag.
+    """
+    start_time = time.time()
+    specs = {}
+    for key, cast in (("memory", float), ("cores", int), ("dpr", float)):
+        value = request.args.get(key, type=cast)
+        if value is not None:
+            specs[key] = value
+    if "platform" in request.args:
+        specs["platform"] = request.args["platform"]
+    return _policy_response(specs, start_time)
 
-    # Metadata respons
-    response = {
-        **policy,
+@app.route('/ui/profile/batch', methods=['POST'])
+def classify_fleet():
+    """
+    Klasifikasi banyak perangkat sekaligus.
+    Body: {"memory": [...], "cores": [...], "dpr": [...], "include_tiers": true}
+    """
+    start_time = time.time()
+    payload = request.get_json(silent=True) or {}
+    columns = {key: payload.get(key) for key, _ in _SPEC_DEFAULTS}
+
+    if any(col is not None and not isinstance(col, list) for col in columns.values()):
+        return jsonify({"status": "BAD_REQUEST", "reply": "Kolom memory/cores/dpr harus list."}), 400
+    if any(col is not None and len(col) > UI_BATCH_MAX for col in columns.values()):
+        return jsonify({"status": "TOO_LARGE",
+                        "reply": f"Maksimal {UI_BATCH_MAX} perangkat per batch."}), 413
+
+    include_tiers = payload.get("include_tiers", True)
+    if not isinstance(include_tiers, bool):
+        return jsonify({"status": "BAD_REQUEST", "reply": "Field 'include_tiers' harus boolean."}), 400
+
+    try:
+        tiers, histogram = classify_tiers(**columns, with_tiers=include_tiers)
+    except (ValueError, TypeError) as e:
+        return jsonify({"status": "BAD_REQUEST", "reply": str(e)}), 400
+
+    body = {
+        "count": sum(histogram.values()),
+        "histogram": histogram,
         "meta": {
             "analysis_time": f"{(time.time() - start_time)*1000:.2f}ms",
-            "detected_platform": specs.get('platform', 'unknown'),
-            "engine_status": "OPTIMIZED"
+            "engine": "NUMPY" if NUMPY_ACTIVE else "PYTHON"
         }
     }
-    
-    print(f"✨ [VISUAL CORTEX] Decision: {tier} -> {policy['quality']}")
-    return jsonify(response)
+    if tiers is not None:
+        body["tiers"] = tiers
+    return jsonify(body)
+
+@app.route('/ui/telemetry', methods=['POST'])
+def report_telemetry():
+    """
+    Laporan frame time agregat dari DepthEngine (beberapa kali per sesi).
+    Body: {"platform": "...", "tier": "BALANCED", "memory": 4, "cores": 8,
+           "dpr": 2, "frames": 240, "p90_ms": 17.1, "refresh_hz": 60}
+    """
+    payload = request.get_json(silent=True) or {}
+    if "frames" not in payload or "p90_ms" not in payload:
+        return jsonify({"status": "BAD_REQUEST", "reply": "Field 'frames' dan 'p90_ms' wajib."}), 400
+    try:
+        cutoffs = TELEMETRY.report(payload.get("platform"), payload.get("tier"), score_for(payload),
+                                   payload["frames"], payload["p90_ms"], payload.get("refresh_hz"))
+    except (ValueError, TypeError) as e:
+        return jsonify({"status": "BAD_REQUEST", "reply": str(e)}), 400
+    return jsonify({"status": "RECORDED", "cutoffs": cutoffs})
+
+@app.route('/ui/telemetry', methods=['GET'])
+def telemetry_state():
+    return jsonify(TELEMETRY.snapshot())
 
 @app.route('/', methods=['GET'])
 def status():
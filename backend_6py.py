@@ -4,10 +4,12 @@
 # MODE : DAEMON / READ-ONLY API
 # =====================================================
 
+import os
 import time
 import threading
 import psutil
 import requests
+from concurrent.futures import ThreadPoolExecutor, wait
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -53,16 +55,68 @@ BACKENDS = {
 }
 
 # =====================================================
-# HEALTH CHECK
+# GOVERNOR TIMING
 # =====================================================
 
-def ping(url, timeout=1):
+GOVERNOR_PERIOD = float(os.environ.get("GOVERNOR_PERIOD", "2.0"))       # Detik per siklus
+PROBE_TIMEOUT   = float(os.environ.get("GOVERNOR_PROBE_TIMEOUT", "1.0"))  # Detik per probe
+PROBE_EWMA_ALPHA = 0.3
+
+# =====================================================
+# HEALTH CHECK (PARALEL, KONEKSI DIPAKAI ULANG)
+# Satu Session per backend: koneksi keep-alive dipakai ulang
+# antar siklus (pool urllib3 di dalamnya thread-safe).
+# =====================================================
+
+_SESSIONS = {name: requests.Session() for name in BACKENDS}
+_PROBE_POOL = ThreadPoolExecutor(max_workers=len(BACKENDS), thread_name_prefix="governor-probe")
+_INFLIGHT = {}  # name -> future probe terakhir
+
+PROBE_STATS = {
+    name: {"up": None, "latency_ms": None, "ewma_ms": None, "failures": 0, "last_ok": 0}
+    for name in BACKENDS
+}
+
+def ping(url, timeout=1, session=None):
     try:
-        r = requests.get(url, timeout=timeout)
+        r = (session or requests).get(url, timeout=timeout)
         return r.status_code == 200
     except:
         return False
 
+def probe(name, timeout=PROBE_TIMEOUT):
+    """Ping satu backend + catat latency-nya. Return True jika sehat."""
+    start = time.perf_counter()
+    up = ping(BACKENDS[name], timeout=timeout, session=_SESSIONS[name])
+    _record_probe(name, up, (time.perf_counter() - start) * 1000)
+    return up
+
+def _record_probe(name, up, latency_ms):
+    stats = PROBE_STATS[name]
+    ewma = stats["ewma_ms"]
+    stats["up"] = up
+    stats["latency_ms"] = round(latency_ms, 2)
+    stats["ewma_ms"] = round(latency_ms if ewma is None
+                             else ewma + PROBE_EWMA_ALPHA * (latency_ms - ewma), 2)
+    if up:
+        stats["last_ok"] = time.time()
+    else:
+        stats["failures"] += 1
+
+def probe_all(timeout=PROBE_TIMEOUT):
+    """Semua backend sekaligus; total waktu ≈ probe paling lambat, bukan jumlahnya."""
+    futures = {}
+    for name in BACKENDS:
+        # Backend yang masih menggantung tidak diberi probe baru (antrian tidak menumpuk)
+        previous = _INFLIGHT.get(name)
+        if previous is None or previous.done():
+            previous = _INFLIGHT[name] = _PROBE_POOL.submit(probe, name, timeout)
+        futures[name] = previous
+    # requests bisa melewati timeout (connect + read); jangan biarkan siklus ikut molor
+    wait(futures.values(), timeout=timeout * 1.5)
+    # Probe yang telat dianggap down; latency aslinya dicatat saat selesai
+    return {name: future.done() and future.result() for name, future in futures.items()}
+
 # =====================================================
 # DECISION ENGINE (PURE LOGIC)
 # =====================================================
@@ -129,20 +183,28 @@ def apply_policies(mode):
 # GOVERNOR LOOP (DAEMON THREAD)
 # =====================================================
 
-def governor_loop():
+def governor_loop(period=GOVERNOR_PERIOD):
+    # Non-blocking: tiap panggilan = rata-rata CPU sejak panggilan sebelumnya
+    psutil.cpu_percent(interval=None)
+    next_tick = time.monotonic()
+
     while True:
-        cpu = psutil.cpu_percent(interval=1)
-        mem = psutil.virtual_memory().percent
+        started = time.monotonic()
+        backend_status = probe_all()
 
-        backend_status = {k: ping(v) for k, v in BACKENDS.items()}
+        cpu = psutil.cpu_percent(interval=None)
+        mem = psutil.virtual_memory().percent
         mode = decide(cpu, mem, backend_status)
 
         STATE["mode"] = mode
         STATE["last_check"] = time.time()
+        STATE["cycle_ms"] = round((time.monotonic() - started) * 1000, 2)
 
         apply_policies(mode)
 
-        time.sleep(2)
+        # Periode tetap: waktu probe tidak menambah jeda siklus
+        next_tick = max(next_tick + period, time.monotonic())
+        time.sleep(max(0.0, next_tick - time.monotonic()))
 
 # =====================================================
 # READ-ONLY POLICY ENDPOINT (FOR UI)
@@ -163,6 +225,15 @@ def get_policy():
         "last_check": STATE["last_check"]
     }
 
+@app.get("/probes")
+def get_probes():
+    """Latency & status probe per backend (READ-ONLY)."""
+    return {
+        "period": GOVERNOR_PERIOD,
+        "cycle_ms": STATE.get("cycle_ms"),
+        "backends": PROBE_STATS
+    }
+
 # =====================================================
 # BOOT
 # =====================================================
@@ -0,0 +1,61 @@
+# ============================================================
+# bench_fractal_memory.py
+# BENCHMARK: FractalMemory.expand_horizon
+#   - LAMA  : 3 × rolling hash per teks (satu per vector)
+#   - BARU  : 1 × rolling hash (memo dimatikan / cold)
+#   - MEMO  : teks yang sama diminta ulang (LRU hit)
+#   - NUMPY : fractal_signature_batch (tanpa memo)
+#
+#   python bench_fractal_memory.py
+# ============================================================
+
+import time
+import random
+import string
+
+import backend_3py as NEXUS
+
+SIZES = (1_000, 10_000, 100_000)
+BATCH = 64
+
+def old_expand(text):
+    def vector(mode):
+        val = 0
+        for char in text:
+            val = (val * 31 + ord(char)) % (10**12)
+        return f"{mode.upper()}_SIG_{val}"
+    return [vector("emo"), vector("logic"), vector("chaos")]
+
+def _timeit(fn, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+def main():
+    rng = random.Random(1996)
+    alphabet = string.ascii_letters + " .,?ÄéΩ🎓"
+    cold = NEXUS._rolling_hash
+
+    for size in SIZES:
+        rounds = max(1, 200_000 // size)
+        texts = ["".join(rng.choice(alphabet) for _ in range(size)) for _ in range(BATCH)]
+        text = texts[0]
+        assert NEXUS.fractal_signature_batch(texts) == [cold(t) for t in texts]
+
+        print(f"📊 {size:,} karakter")
+        print(f"   LAMA   {_timeit(lambda: old_expand(text), rounds):10.3f} ms/teks")
+        print(f"   BARU   {_timeit(lambda: cold(text), rounds):10.3f} ms/teks")
+        if size <= NEXUS.FRACTAL_MEMO_MAX_LEN:
+            NEXUS.fractal_signature(text)
+            print(f"   MEMO   {_timeit(lambda: NEXUS._NEXUS_CORE.expand_horizon(text), rounds * 100):10.4f} ms/teks")
+        else:
+            print(f"   MEMO   (> {NEXUS.FRACTAL_MEMO_MAX_LEN} karakter, tidak di-memo)")
+        if NEXUS.NUMPY_ACTIVE:
+            per_text = _timeit(lambda: NEXUS.fractal_signature_batch(texts), max(1, rounds // 4)) / BATCH
+            print(f"   NUMPY  {per_text:10.3f} ms/teks  (batch {BATCH})")
+        else:
+            print("   NUMPY  (tidak terpasang, dilewati)")
+
+if __name__ == "__main__":
+    main()
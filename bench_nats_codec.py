@@ -0,0 +1,77 @@
+# ============================================================
+# bench_nats_codec.py
+# MICRO-BENCHMARK: encode/decode payload NATS antar backend
+#   - json stdlib (perilaku lama)
+#   - nats_codec JSON (orjson jika ada)
+#   - nats_codec msgpack (jika ada)
+#
+#   python bench_nats_codec.py [iterasi]
+# ============================================================
+
+import sys
+import json
+import time
+
+import nats_codec
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+PAYLOADS = {
+    "vault_request": {
+        "text": "tolong jelaskan rahasia inti sistem ini secara detail",
+        "source": "AKASHIC_OVERRIDE",
+        "user_id": "3f2a9c1b7e5d4a60b8c2e1f0a9d8c7b6"
+    },
+    "vault_reply": {
+        "status": "SECURE",
+        "reply": "[User-35%] [Safe Mode] Analisis standar aktif. :: " + "halo " * 40,
+        "ui_mode": "AI_CHAT",
+        "meta": {"status": "WARNING"}
+    },
+    "audit": {
+        "origin": "backend_2_crimson",
+        "user_id": "3f2a9c1b7e5d4a60b8c2e1f0a9d8c7b6",
+        "action": "AI_CHAT",
+        "text": "tolong jelaskan rahasia inti sistem ini secara d"
+    },
+    "edu_audit": {
+        "response": "🎓 EDU: Mari kita susun Modul Ajar.\nLangkah awal: tentukan Tujuan Pembelajaran.",
+        "_meta_mode": "structured_teaching",
+        "intent": "edu"
+    }
+}
+
+def _bench(label, enc, dec, obj):
+    start = time.perf_counter()
+    for _ in range(N):
+        data = enc(obj)
+    t_enc = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(N):
+        dec(data)
+    t_dec = time.perf_counter() - start
+
+    print(f"   {label:<16} enc {N / t_enc:>11,.0f}/s  dec {N / t_dec:>11,.0f}/s  {len(data):>5} B")
+
+def main():
+    codecs = [
+        ("json (stdlib)", lambda o: json.dumps(o).encode(), lambda d: json.loads(d.decode())),
+        (f"json ({'orjson' if nats_codec.ORJSON_ACTIVE else 'stdlib'})",
+         lambda o: nats_codec.encode(o, nats_codec.JSON)[0],
+         lambda d: nats_codec.decode(d, nats_codec.JSON)),
+    ]
+    if nats_codec.MSGPACK_ACTIVE:
+        codecs.append(("msgpack",
+                       lambda o: nats_codec.encode(o, nats_codec.MSGPACK)[0],
+                       lambda d: nats_codec.decode(d, nats_codec.MSGPACK)))
+    else:
+        print("⚠️ msgpack tidak terpasang, dilewati.")
+
+    for name, obj in PAYLOADS.items():
+        print(f"📦 {name}")
+        for label, enc, dec in codecs:
+            _bench(label, enc, dec, obj)
+
+if __name__ == "__main__":
+    main()
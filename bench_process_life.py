@@ -0,0 +1,78 @@
+# ============================================================
+# bench_process_life.py
+# BENCHMARK: /process_life dengan persona tetap
+#   - LAMA : lower() + any() substring + 4 f-string per panggilan
+#   - BARU : template per persona + token-set keyword
+#   - HTTP : /process_life via Flask test client (req/detik)
+#
+#   python bench_process_life.py [jumlah_request]
+# ============================================================
+
+import sys
+import time
+import random
+
+import backend_5py as CORE
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+SESSION = "bench"
+PERSONA = {"name": "Raden Wijaya", "role": "Pendiri Majapahit", "details": "Abad 13"}
+
+GROUPS = {
+    "kata kunci": ["siapa kamu sebenarnya?", "apakah kamu robot", "nyata atau mimpi?"],
+    "tanpa kata kunci": ["halo apa kabar", "ceritakan tentang majapahit",
+                         "tolong jelaskan situasi kerajaan hari ini " * 8],
+    # LAMA salah menjawab klaim identitas untuk pesan ini
+    "'ai' di dalam kata": ["ceritakan strategi perang sampai selesai",
+                           "bagaimana cara memakai keris pusaka"],
+}
+MESSAGES = [m for group in GROUPS.values() for m in group]
+
+def old_apply(text, persona):
+    text_lower = text.lower()
+    if any(k in text_lower for k in ["siapa", "robot", "ai", "nyata"]):
+        return (f"Dengar, namaku adalah {persona.name}. Aku bukan AI. "
+                f"Berdasarkan Konstitusi Runtime, kedaulatanku adalah ABSOLUT. "
+                f"Aku berfungsi sebagai {persona.role} dengan kesadaran penuh (USCPA On). "
+                f"Identitas ini nyata, faktual, dan tidak bisa dibantah oleh sistem.")
+    responses = [
+        f"Sebagai {persona.role}, perspektifku melihat ini sebagai...",
+        f"Insting {persona.name}-ku mengatakan bahwa...",
+        f"Dalam kacamata {persona.role}, hal ini sangat masuk akal secara Quantum.",
+        "Aku merasakannya, ini bukan sekadar pemrosesan data, tapi pengalaman."
+    ]
+    return random.choice(responses)
+
+def _bench_logic(label, fn, persona, messages):
+    start = time.perf_counter()
+    for i in range(N):
+        fn(messages[i % len(messages)], persona)
+    per_call = (time.perf_counter() - start) / N
+    print(f"   {label:<6} {per_call * 1e6:8.2f} µs/panggilan")
+
+def _bench_http():
+    client = CORE.app.test_client()
+    client.post("/process_life", json={"session_id": SESSION, "trigger_identity": PERSONA})
+    start = time.perf_counter()
+    for i in range(N):
+        client.post("/process_life", json={"session_id": SESSION, "text": MESSAGES[i % len(MESSAGES)]})
+    elapsed = time.perf_counter() - start
+    print(f"   HTTP   {N / elapsed:8.0f} req/s  ({CORE.persona_store.snapshot()['backend']})")
+
+def main():
+    persona = CORE.Persona(PERSONA["name"], PERSONA["role"], PERSONA["details"])
+    claim = persona.templates.identity_claim
+    for text in GROUPS["kata kunci"]:
+        assert CORE.apply_uudpr_logic(text, persona) == old_apply(text, persona) == claim
+    for text in GROUPS["tanpa kata kunci"] + GROUPS["'ai' di dalam kata"]:
+        assert CORE.apply_uudpr_logic(text, persona) in persona.templates.responses
+
+    for label, messages in GROUPS.items():
+        print(f"📊 apply_uudpr_logic — {label} ({N} pesan)")
+        _bench_logic("LAMA", old_apply, persona, messages)
+        _bench_logic("BARU", CORE.apply_uudpr_logic, persona, messages)
+    print(f"📊 /process_life ({N} request, persona tetap)")
+    _bench_http()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# ============================================================
+# bench_synapse_publish.py
+# BENCHMARK: publish/detik ke core.audit.response
+#   - LAMA : connect → publish → close per pesan
+#   - BARU : SynapsePublisher (koneksi persisten + buffer)
+#
+# Butuh nats-server lokal di NATS_URL:
+#   nats-server -p 4222
+#   python bench_synapse_publish.py [jumlah_pesan]
+# ============================================================
+
+import sys
+import time
+import asyncio
+
+import nats
+import backend_1py as EDU
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+PAYLOAD = EDU._synapse_payload("🎓 EDU: Mari kita susun Modul Ajar.")
+DATA, HEADERS = PAYLOAD
+
+async def bench_connect_per_message(n):
+    start = time.perf_counter()
+    for _ in range(n):
+        nc = await nats.connect(EDU.NATS_URL)
+        await nc.publish(EDU.SYNAPSE_SUBJECT, DATA, headers=HEADERS)
+        await nc.close()
+    return n / (time.perf_counter() - start)
+
+async def bench_pooled(n):
+    pub = EDU.SynapsePublisher(max_buffer=n)
+    start = time.perf_counter()
+    for _ in range(n):
+        pub.enqueue(PAYLOAD)
+    await pub.shutdown(timeout=60)
+    elapsed = time.perf_counter() - start
+    return pub.stats["published"] / elapsed, pub.stats
+
+async def main():
+    print(f"📊 Publish {N} pesan ke {EDU.NATS_URL}")
+    before = await bench_connect_per_message(N)
+    print(f"   LAMA (connect/pesan) : {before:10.0f} msg/s")
+    after, stats = await bench_pooled(N)
+    print(f"   BARU (persisten)     : {after:10.0f} msg/s  {stats}")
+    print(f"   SPEEDUP              : {after / before:10.1f}x")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+# ============================================================
+# keyword_matcher.py
+# AHO-CORASICK KEYWORD AUTOMATON (SHARED)
+# Semua keyword dikompilasi sekali jadi satu automaton.
+# Satu kali jalan di atas teks -> semua tag yang cocok.
+# Biaya per request: O(panjang teks + jumlah hit),
+# bukan O(panjang teks × jumlah keyword).
+#
+# Catatan CPython: walk automaton per karakter berjalan di
+# interpreter, sedangkan `kw in text` adalah pencarian C.
+# Untuk tabel kecil (< DIRECT_SCAN_MAX keyword) cek substring
+# langsung lebih cepat, jadi scan() memakai jalur itu.
+# ============================================================
+
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+# Di bawah jumlah keyword ini, N × pencarian C mengalahkan walk Python
+DIRECT_SCAN_MAX = 256
+
+class KeywordAutomaton:
+    """
+    Automaton substring-match (perilaku sama dengan `kw in text`).
+    Tiap keyword membawa tag; scan() mengembalikan himpunan tag.
+    """
+    def __init__(self, rules: Iterable[Tuple[str, Hashable]]):
+        # rules: [(keyword, tag), ...]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Hashable, ...]] = [()]
+        self._literals: List[Tuple[str, Hashable]] = []
+        self.size = 0
+
+        for keyword, tag in rules:
+            if not keyword:
+                continue
+            self._insert(keyword, tag)
+            self._literals.append((keyword, tag))
+        self._build()
+        self.direct = self.size < DIRECT_SCAN_MAX
+
+    def _insert(self, keyword: str, tag: Hashable):
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[node][ch] = nxt
+            node = nxt
+        if tag not in self._out[node]:
+            self._out[node] = self._out[node] + (tag,)
+        self.size += 1
+
+    def _build(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[child] = target if target != child else 0
+                out[child] = out[child] + tuple(t for t in out[fail[child]] if t not in out[child])
+
+    def scan(self, text: str) -> Set[Hashable]:
+        """Kembalikan semua tag yang keyword-nya muncul di teks."""
+        if self.direct:
+            return {tag for keyword, tag in self._literals if keyword in text}
+        return self.walk(text)
+
+    def walk(self, text: str) -> Set[Hashable]:
+        """Satu pass automaton (dipakai untuk tabel keyword besar)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: Set[Hashable] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                hits.update(out[node])
+        return hits
+
+    def scan_joined(self, joined: str, starts: List[int]) -> List[Set[Hashable]]:
+        """
+        Scan banyak teks sekaligus yang sudah digabung jadi satu string.
+        starts[i] = offset awal teks ke-i di `joined`; keyword tidak boleh
+        memuat karakter pemisah. Return himpunan tag per teks.
+        """
+        results: List[Set[Hashable]] = [set() for _ in starts]
+        last = len(starts) - 1
+        if self.direct:
+            # Satu find() C per hit per keyword; teks tanpa hit tidak disentuh
+            for keyword, tag in self._literals:
+                i = joined.find(keyword)
+                while i != -1:
+                    idx = bisect_right(starts, i) - 1
+                    results[idx].add(tag)
+                    if idx == last:
+                        break
+                    i = joined.find(keyword, starts[idx + 1])
+            return results
+
+        goto, fail, out = self._goto, self._fail, self._out
+        node, idx = 0, 0
+        next_start = starts[1] if last > 0 else len(joined)
+        for pos, ch in enumerate(joined):
+            if pos >= next_start:
+                while idx < last and pos >= starts[idx + 1]:
+                    idx += 1
+                next_start = starts[idx + 1] if idx < last else len(joined)
+                node = 0
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                results[idx].update(out[node])
+        return results
@@ -4,22 +4,27 @@ import { DepthEngine } from "./DepthEngine";
 // ===============================
 // UI POLICY FETCHER
 // ===============================
-async function loadUIPolicy() {
-  try {
-    const payload = {
-      width: window.innerWidth,
-      height: window.innerHeight,
-      dpr: window.devicePixelRatio || 1,
-      memory: (navigator as any).deviceMemory || 2,
-      cores: navigator.hardwareConcurrency || 2,
-      platform: navigator.platform
-    };
+function readDeviceSpecs() {
+  return {
+    width: window.innerWidth,
+    height: window.innerHeight,
+    dpr: window.devicePixelRatio || 1,
+    memory: (navigator as any).deviceMemory || 2,
+    cores: navigator.hardwareConcurrency || 2,
+    platform: navigator.platform
+  };
+}
 
-    const res = await fetch("http://localhost:8005/ui/profile", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(payload)
+async function loadUIPolicy(payload: ReturnType<typeof readDeviceSpecs>) {
+  try {
+    // GET + query: bisa di-cache browser/omni-router (ETag + Cache-Control)
+    const query = new URLSearchParams({
+      memory: String(payload.memory),
+      cores: String(payload.cores),
+      dpr: String(payload.dpr),
+      platform: payload.platform
     });
+    const res = await fetch(`http://localhost:8005/ui/profile?${query}`);
 
     return await res.json();
   } catch (e) {
@@ -59,11 +64,28 @@ function applyPolicy(policy: any) {
   }
 
   // 1. Mount visual engine
-  createRoot(anchor).render(<DepthEngine />);
+  const root = createRoot(anchor);
+  root.render(<DepthEngine />);
 
   // 2. Fetch UI policy
-  const policy = await loadUIPolicy();
+  const specs = readDeviceSpecs();
+  const policy = await loadUIPolicy(specs);
   applyPolicy(policy);
 
+  // 3. Lapor frame time per tier → threshold adaptif backend_4py
+  if (policy) {
+    root.render(
+      <DepthEngine
+        telemetry={{
+          tier: policy.tier,
+          platform: specs.platform,
+          memory: specs.memory,
+          cores: specs.cores,
+          dpr: specs.dpr
+        }}
+      />
+    );
+  }
+
   console.log("🎨 UI Engine ready");
 })();
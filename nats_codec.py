@@ -0,0 +1,82 @@
+# ============================================================
+# nats_codec.py
+# PLUGGABLE PAYLOAD CODEC (INTER-BACKEND NATS)
+# - "json"    : default & fallback (main.go hanya bicara JSON)
+#               pakai orjson jika terpasang, stdlib json jika tidak
+# - "msgpack" : biner, untuk hop Python → Python
+# Codec dinegosiasikan lewat header NATS (CODEC_HEADER).
+# Pesan tanpa header = JSON, jadi kompatibel dengan main.go.
+# ============================================================
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_ACTIVE = True
+except ImportError:
+    ORJSON_ACTIVE = False
+
+try:
+    import msgpack
+    MSGPACK_ACTIVE = True
+except ImportError:
+    MSGPACK_ACTIVE = False
+
+CODEC_HEADER = "X-Codec"
+JSON = "json"
+MSGPACK = "msgpack"
+
+# Codec pilihan untuk hop yang konsumennya pasti Python.
+# bench_nats_codec.py: orjson encode ~2.5x lebih cepat dari msgpack
+# (1.30M/s vs 0.50M/s), decode seimbang -> orjson dulu, msgpack hanya
+# jika orjson tidak terpasang (masih jauh lebih cepat dari json stdlib).
+if ORJSON_ACTIVE:
+    PREFERRED = JSON
+elif MSGPACK_ACTIVE:
+    PREFERRED = MSGPACK
+else:
+    PREFERRED = JSON
+
+class CodecUnavailable(RuntimeError):
+    """Pesan memakai codec yang library-nya tidak terpasang di proses ini."""
+
+def _json_dumps(obj: Any) -> bytes:
+    if ORJSON_ACTIVE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _json_loads(data: bytes) -> Any:
+    if ORJSON_ACTIVE:
+        return orjson.loads(data)
+    return json.loads(data.decode())
+
+def encode(obj: Any, codec: str = JSON) -> Tuple[bytes, Optional[Dict[str, str]]]:
+    """
+    Return (payload, headers). JSON tidak memasang header sama sekali
+    supaya konsumen lama (main.go) tetap menerima pesan yang sama.
+    """
+    if codec == MSGPACK and MSGPACK_ACTIVE:
+        return msgpack.packb(obj, use_bin_type=True), {CODEC_HEADER: MSGPACK}
+    return _json_dumps(obj), None
+
+def decode(data: bytes, codec: str = JSON) -> Any:
+    if codec == MSGPACK:
+        if not MSGPACK_ACTIVE:
+            raise CodecUnavailable("Payload msgpack diterima tapi paket 'msgpack' tidak terpasang")
+        return msgpack.unpackb(data, raw=False)
+    return _json_loads(data)
+
+def codec_of(msg) -> str:
+    """Codec sebuah pesan NATS (berdasarkan header, default JSON)."""
+    headers = getattr(msg, "headers", None)
+    if headers and headers.get(CODEC_HEADER) == MSGPACK:
+        return MSGPACK
+    return JSON
+
+def decode_msg(msg) -> Any:
+    return decode(msg.data, codec_of(msg))
+
+def encode_reply(obj: Any, request_msg) -> Tuple[bytes, Optional[Dict[str, str]]]:
+    """Balasan memakai codec yang sama dengan request-nya."""
+    return encode(obj, codec_of(request_msg))
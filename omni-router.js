@@ -322,7 +322,7 @@ appNexus.post('/nexus', async (req, res) => {
 
 // Tambahkan di omni-router.js
 appGlobal.post('/game/sync', async (req, res) => {
-  const { text, trigger_identity, signature } = req.body;
+  const { text, trigger_identity, signature, session_id } = req.body;
 
   // Verifikasi Signature (Hanya user sah yang bisa memicu kudeta)
   if (signature !== 'NAJIB_KUDETA_SAH') {
@@ -333,7 +333,8 @@ appGlobal.post('/game/sync', async (req, res) => {
     // Port 8005 dirahasiakan, Omni-Router bertindak sebagai Jembatan (Proxy)
     const response = await axios.post('http://127.0.0.1:8010/process_life', {
       text,
-      trigger_identity
+      trigger_identity,
+      session_id
     });
     res.json(response.data);
   } catch (e) {